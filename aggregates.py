@@ -0,0 +1,117 @@
+from preprocess import CHUNK_SIZE, DATA_PATH, concat_frames, read_chunks
+
+# ------------------------------------
+# Cubo de agregados
+#
+# Todas as abas do dashboard são contagens e médias de custo sobre as mesmas
+# dimensões. Em vez de varrer a tabela completa a cada gráfico, montamos uma
+# vez por versão dos dados um cubo compacto com contagem e soma/quantidade de
+# custo por combinação de dimensões; os gráficos leem apenas do cubo.
+#
+# As medidas são somas, então cubos de partes diferentes dos dados podem ser
+# combinados com merge_cubes. É isso que permite montar o cubo lendo o CSV em
+# blocos (stream_aggregates) sem nunca ter a tabela completa na memória.
+#
+# Ao lado do cubo fica a contagem diária de lançamentos, com as dimensões dos
+# filtros, de onde sai a série temporal em várias resoluções (timeseries.py).
+# Cubo e contagem diária são montados e combinados juntos, em um dict
+# {'cube': ..., 'daily': ...}.
+
+DIMENSOES = ['Country', 'Company Name', 'Year', 'Month', 'Weekday', 'Mission Status', 'Status Rocket']
+MEDIDAS = ['Count', 'Cost Sum', 'Cost Count']
+
+DIMENSOES_DIA = ['Date', 'Year', 'Country', 'Company Name', 'Mission Status', 'Status Rocket']
+
+
+def build_cube(df):
+    base = df.assign(Year=df['Date'].dt.year, Month=df['Date'].dt.month)
+    cube = (
+        base.groupby(DIMENSOES, dropna=False, observed=True)
+        .agg(**{
+            'Count': ('Mission Status', 'size'),
+            'Cost Sum': ('Mission Cost', 'sum'),
+            'Cost Count': ('Mission Cost', 'count'),
+        })
+        .reset_index()
+    )
+    return cube
+
+
+def merge_cubes(cubes):
+    # Soma as medidas de cubos parciais (blocos ou arquivos diferentes).
+    # concat_frames mantém as dimensões categóricas (e a ordem dos dias da
+    # semana) mesmo quando as categorias das partes diferem
+    return (
+        concat_frames(cubes)
+        .groupby(DIMENSOES, dropna=False, observed=True)[MEDIDAS]
+        .sum()
+        .reset_index()
+    )
+
+
+def build_daily(df):
+    base = df.assign(Year=df['Date'].dt.year)
+    return base.groupby(DIMENSOES_DIA, dropna=False, observed=True).size().reset_index(name='Count')
+
+
+def merge_daily(partes):
+    return (
+        concat_frames(partes)
+        .groupby(DIMENSOES_DIA, dropna=False, observed=True)['Count']
+        .sum()
+        .reset_index()
+    )
+
+
+def build_aggregates(df):
+    return {'cube': build_cube(df), 'daily': build_daily(df)}
+
+
+def merge_aggregates(partes):
+    return {
+        'cube': merge_cubes([p['cube'] for p in partes]),
+        'daily': merge_daily([p['daily'] for p in partes]),
+    }
+
+
+def fold_aggregates(blocos, agregados=None):
+    # Acumula nos agregados os blocos já limpos, um de cada vez
+    for bloco in blocos:
+        parcial = build_aggregates(bloco)
+        agregados = parcial if agregados is None else merge_aggregates([agregados, parcial])
+    return agregados
+
+
+def stream_aggregates(path=DATA_PATH, chunksize=CHUNK_SIZE, fim=None):
+    # Monta os agregados bloco a bloco: a memória usada depende do tamanho do
+    # bloco e dos agregados, não do tamanho do arquivo
+    return fold_aggregates(read_chunks(path, chunksize, fim=fim))
+
+
+def counts_by(cube, colunas):
+    # Número de missões por uma ou mais dimensões
+    return cube.groupby(colunas, observed=True)['Count'].sum()
+
+
+def top_counts(cube, coluna, n=None):
+    # Contagem em ordem decrescente, como o value_counts do pandas
+    contagem = counts_by(cube, coluna).sort_values(ascending=False, kind='stable')
+    return contagem if n is None else contagem.head(n)
+
+
+def cost_mean_by(cube, coluna):
+    # Custo médio = soma dos custos / quantidade de missões com custo informado
+    custos = cube.groupby(coluna, observed=True)[['Cost Sum', 'Cost Count']].sum()
+    return custos['Cost Sum'] / custos['Cost Count'].where(custos['Cost Count'] > 0)
+
+
+def success_ratio_by(cube, coluna):
+    # Sucessos, falhas e razão de sucesso por uma dimensão
+    status = counts_by(cube, [coluna, 'Mission Status']).unstack(fill_value=0)
+    status = status.reindex(columns=['Failure', 'Success'], fill_value=0)
+    status['Success Ratio'] = status['Success'] / (status['Success'] + status['Failure'])
+    return status
+
+
+def success_ratio_by_year(cube):
+    return success_ratio_by(cube, 'Year')
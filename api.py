@@ -0,0 +1,298 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from aggregates import DIMENSOES, cost_mean_by, counts_by, success_ratio_by
+from cache import LRUCache
+from export import ARTIFACTS_DIR, ArtifactLoader
+from filters import COLUNAS, COLUNAS_CUBO, CubeIndex, normalize_filters
+from incremental import make_loader
+from preprocess import DATA_PATH
+
+# ------------------------------------
+# Consulta aos agregados sem passar pelo Streamlit
+#
+# Os mesmos números do dashboard (contagens, razão de sucesso e custo médio
+# por país, empresa, ano, ...) para outros serviços, a partir dos mesmos
+# dados: o carregador de incremental.py (com MISSIONS_SHARED=1, a cópia em
+# memória compartilhada) ou uma exportação (MISSIONS_ARTIFACTS). Os filtros
+# usam o índice do cubo de filters.py, e cada resposta fica em cache por
+# versão dos dados, consulta, filtros e página, com uma ETag para que o
+# cliente só receba o corpo de novo quando os dados mudarem.
+#
+# Como módulo:
+#   api = MissionsAPI()
+#   api.query('counts', by='Country', filters={'Country': ['USA']}, years=(2000, 2020), limit=10)
+#
+# Como servidor HTTP local (JSON):
+#   python api.py --port 8502
+#   GET /v1                          -> consultas, dimensões e filtros aceitos
+#   GET /v1/counts?by=country&country=USA&country=Russia&year=2000-2020&sort=value&limit=10&offset=0
+#   GET /v1/success_ratio?by=year&month=1&month=2&weekday=Mon
+#   GET /v1/cost_mean?by=company
+#
+# Erros saem em JSON ({"error": ...}): 400 para parâmetros inválidos, 404
+# para caminhos ou consultas desconhecidos, 503 quando os dados não puderam
+# ser carregados e 500 para falhas internas.
+
+logger = logging.getLogger("missoes.api")
+
+# Tamanho padrão e máximo de uma página de resultados
+LIMITE = 100
+MAX_LIMITE = 1000
+
+# Respostas guardadas (o orçamento é o tamanho dos corpos em JSON)
+CACHE_TTL = float(os.environ.get("MISSIONS_CACHE_TTL", 600))
+CACHE_MAX_MB = float(os.environ.get("MISSIONS_CACHE_MAX_MB", 256))
+
+# Nomes das dimensões nos parâmetros da URL
+PARAMETROS = {
+    'country': 'Country',
+    'company': 'Company Name',
+    'year': 'Year',
+    'month': 'Month',
+    'weekday': 'Weekday',
+    'mission_status': 'Mission Status',
+    'status_rocket': 'Status Rocket',
+}
+
+# Colunas aceitas como filtro (além do intervalo de anos)
+FILTROS = COLUNAS + COLUNAS_CUBO
+
+# Parâmetros da URL que não são filtros
+OPCOES = ['by', 'sort', 'offset', 'limit']
+
+
+class QueryError(Exception):
+    # Parâmetros inválidos na consulta (HTTP 400)
+    pass
+
+
+class UnknownQuery(QueryError):
+    # Consulta que não existe (HTTP 404)
+    pass
+
+
+class DataUnavailable(Exception):
+    # Os dados não puderam ser carregados (HTTP 503); a causa fica em
+    # __cause__
+    pass
+
+
+def _counts(cube, coluna):
+    return counts_by(cube, coluna).to_frame('Count')
+
+
+def _success_ratio(cube, coluna):
+    status = success_ratio_by(cube, coluna)
+    status.columns = list(status.columns)
+    return status
+
+
+def _cost_mean(cube, coluna):
+    # Grupos sem nenhum custo informado ficam de fora
+    return cost_mean_by(cube, coluna).dropna().to_frame('Cost Mean')
+
+
+# Consultas: nome -> (função sobre o cubo, coluna de valor usada em
+# sort=value, dimensões aceitas em 'by')
+CONSULTAS = {
+    'counts': (_counts, 'Count', DIMENSOES),
+    'success_ratio': (_success_ratio, 'Success Ratio', [d for d in DIMENSOES if d != 'Mission Status']),
+    'cost_mean': (_cost_mean, 'Cost Mean', DIMENSOES),
+}
+
+
+class MissionsAPI:
+
+    def __init__(self, loader=None):
+        if loader is None:
+            loader = ArtifactLoader(ARTIFACTS_DIR) if ARTIFACTS_DIR else make_loader(DATA_PATH)
+        self.loader = loader
+        # Índice dos filtros por versão dos dados
+        self._indices = LRUCache(maxsize=2)
+        # Cubo filtrado por versão e filtros
+        self._filtrados = LRUCache(maxsize=64, ttl=CACHE_TTL)
+        # Corpo JSON e ETag de cada resposta
+        self.responses = LRUCache(maxsize=1024, ttl=CACHE_TTL, max_bytes=int(CACHE_MAX_MB * 2**20) // 2,
+                                  sizeof=lambda item: len(item[0]))
+
+    def describe(self):
+        dados = self._dataset()
+        indice = self._index(dados)
+        return {
+            'version': dados.version,
+            'queries': {nome: dimensoes for nome, (_, _, dimensoes) in CONSULTAS.items()},
+            'filters': {coluna: indice.options(coluna) for coluna in FILTROS},
+            'years': indice.year_range(),
+        }
+
+    def query(self, consulta, by, filters=None, years=None, sort='key', offset=0, limit=LIMITE):
+        # Resultado de uma consulta como dict (ver response para o JSON)
+        return json.loads(self.response(consulta, by, filters, years, sort, offset, limit)[0])
+
+    def response(self, consulta, by, filters=None, years=None, sort='key', offset=0, limit=LIMITE):
+        # (corpo JSON, ETag) de uma consulta, do cache quando possível
+        if consulta not in CONSULTAS:
+            raise UnknownQuery(f"consulta desconhecida: {consulta}")
+        funcao, valor, dimensoes = CONSULTAS[consulta]
+        if by not in dimensoes:
+            raise QueryError(f"'by' deve ser uma de {dimensoes}")
+        if sort not in ('key', 'value'):
+            raise QueryError("'sort' deve ser 'key' ou 'value'")
+        if offset < 0 or not 1 <= limit <= MAX_LIMITE:
+            raise QueryError(f"'offset' deve ser >= 0 e 'limit' entre 1 e {MAX_LIMITE}")
+        for coluna in filters or {}:
+            if coluna not in FILTROS:
+                raise QueryError(f"filtro desconhecido: {coluna}")
+        if years is not None and years[0] > years[1]:
+            raise QueryError(f"intervalo de anos invertido: {years[0]}-{years[1]}")
+
+        dados = self._dataset()
+        indice = self._index(dados)
+        filtros = normalize_filters(years, indice.year_range(), filters)
+        key = (dados.version, consulta, by, filtros, sort, offset, limit)
+        item = self.responses.get(key)
+        if item is None:
+            cube = self._filtrados.get_or_build((dados.version, filtros), lambda: indice.filter(dados.cube, filtros))
+            tabela = funcao(cube, by)
+            if sort == 'value':
+                tabela = tabela.sort_values(valor, ascending=False, kind='stable')
+            linhas = tabela.iloc[offset:offset + limit].reset_index().to_dict('records')
+            corpo = json.dumps({
+                'version': dados.version,
+                'query': consulta,
+                'by': by,
+                'filters': {coluna: valores for coluna, valores in filtros},
+                'total': len(tabela),
+                'offset': offset,
+                'limit': limit,
+                'rows': linhas,
+            }, default=_json).encode()
+            item = (corpo, '"' + hashlib.sha256(corpo).hexdigest()[:32] + '"')
+            self.responses.put(key, item)
+        return item
+
+    def _dataset(self):
+        # Versão atual dos dados. Falhas do carregador (CSV ou exportação
+        # ausentes, primeira carga com erro) viram DataUnavailable
+        try:
+            return self.loader.refresh()
+        except Exception as erro:
+            raise DataUnavailable(f"dados indisponíveis: {erro}") from erro
+
+    def _index(self, dados):
+        return self._indices.get_or_build(dados.version, lambda: CubeIndex(dados.cube))
+
+
+def _json(valor):
+    # Números do numpy que sobram nas tabelas
+    if hasattr(valor, 'item'):
+        return valor.item()
+    raise TypeError(f"não serializável em JSON: {type(valor).__name__}")
+
+
+def parse_query(parametros):
+    # Parâmetros da URL (parse_qs) -> argumentos de MissionsAPI.response
+    def unico(nome, padrao=None):
+        valores = parametros.get(nome)
+        return valores[-1] if valores else padrao
+
+    # Um parâmetro ignorado devolveria totais sem o filtro pedido
+    desconhecidos = sorted(set(parametros) - set(OPCOES) - set(PARAMETROS))
+    if desconhecidos:
+        raise QueryError(f"parâmetros desconhecidos: {', '.join(desconhecidos)} (aceitos: {', '.join(OPCOES + list(PARAMETROS))})")
+
+    by = unico('by', '')
+    argumentos = {'by': PARAMETROS.get(by, by), 'sort': unico('sort', 'key'), 'filters': {}}
+    try:
+        argumentos['offset'] = int(unico('offset', 0))
+        argumentos['limit'] = int(unico('limit', LIMITE))
+        if 'year' in parametros:
+            # year=2000 ou year=2000-2020
+            inicio, _, fim = unico('year').partition('-')
+            argumentos['years'] = (int(inicio), int(fim or inicio))
+        if 'month' in parametros:
+            argumentos['filters']['Month'] = [int(mes) for mes in parametros['month']]
+    except ValueError:
+        raise QueryError("'offset', 'limit', 'year' e 'month' devem ser números (year=2000 ou year=2000-2020)") from None
+    for nome, coluna in PARAMETROS.items():
+        if coluna in FILTROS and coluna not in argumentos['filters'] and nome in parametros:
+            argumentos['filters'][coluna] = parametros[nome]
+    return argumentos
+
+
+class APIHandler(BaseHTTPRequestHandler):
+    # O servidor guarda a MissionsAPI em 'api' (ver make_server)
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        partes = [p for p in url.path.split('/') if p]
+        try:
+            if partes == ['v1']:
+                self._send(HTTPStatus.OK, json.dumps(self.server.api.describe()).encode())
+            elif len(partes) == 2 and partes[0] == 'v1':
+                corpo, etag = self.server.api.response(partes[1], **parse_query(parse_qs(url.query)))
+                if etag in self.headers.get('If-None-Match', ''):
+                    self._send(HTTPStatus.NOT_MODIFIED, b'', etag)
+                else:
+                    self._send(HTTPStatus.OK, corpo, etag)
+            else:
+                self._error(HTTPStatus.NOT_FOUND, f"caminho desconhecido: {url.path}")
+        except UnknownQuery as erro:
+            self._error(HTTPStatus.NOT_FOUND, str(erro))
+        except QueryError as erro:
+            self._error(HTTPStatus.BAD_REQUEST, str(erro))
+        except DataUnavailable as erro:
+            logger.error("%s: %r", erro, erro.__cause__)
+            self._error(HTTPStatus.SERVICE_UNAVAILABLE, str(erro))
+        except Exception:
+            # Erro interno: o cliente recebe uma resposta em vez de uma
+            # conexão derrubada, e o traceback fica no log
+            logger.exception("falha ao responder %s", self.path)
+            self._error(HTTPStatus.INTERNAL_SERVER_ERROR, "erro interno")
+
+    def _error(self, status, mensagem):
+        self._send(status, json.dumps({'error': mensagem}).encode())
+
+    def _send(self, status, corpo, etag=None):
+        self.send_response(status)
+        if etag is not None:
+            self.send_header('ETag', etag)
+            # Os dados mudam quando a origem muda: o cliente revalida com a ETag
+            self.send_header('Cache-Control', 'no-cache')
+        if status != HTTPStatus.NOT_MODIFIED:
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def log_message(self, formato, *args):
+        logger.info("%s - " + formato, self.address_string(), *args)
+
+
+def make_server(api, host='127.0.0.1', port=8502):
+    servidor = ThreadingHTTPServer((host, port), APIHandler)
+    servidor.api = api
+    return servidor
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8502)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    servidor = make_server(MissionsAPI(), args.host, args.port)
+    logger.info("API em http://%s:%d/v1", args.host, args.port)
+    servidor.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
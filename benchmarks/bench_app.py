@@ -0,0 +1,184 @@
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+# ------------------------------------
+# Benchmark do dashboard
+#
+# Para cada tamanho de dados, gera um CSV sintético (benchmarks/synthetic.py)
+# e, em um processo separado apontado para ele via MISSIONS_DATA, mede:
+#   - as etapas fora do Streamlit: hash do CSV, limpeza + snapshot, leitura
+#     do snapshot, cubo de agregados e a montagem de cada gráfico, com o
+#     tamanho do JSON de cada figura;
+#   - cada página rodada sem interface pelo AppTest do Streamlit, na primeira
+#     execução (caches vazios) e na segunda (caches cheios), com o tamanho
+#     total dos gráficos enviados ao navegador;
+#   - o pico de memória (RSS máximo do processo ao fim de cada etapa; o
+#     tracemalloc deixaria as etapas várias vezes mais lentas).
+#
+# O resultado sai em JSON para comparar versões do código:
+#   python benchmarks/bench_app.py --json antes.json
+#   (alterações)
+#   python benchmarks/bench_app.py --json depois.json --compare antes.json
+
+PAGINAS = ['pais', 'datas', 'empresa', 'missao', 'foguete', 'custo']
+TAMANHOS = [10_000, 100_000, 1_000_000]
+DATA_DIR = os.path.join(RAIZ, 'benchmarks', '.data')
+
+
+def max_rss():
+    # ru_maxrss é em KiB no Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def medir(funcao, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def bench_sections(path):
+    # Importados aqui: preprocess lê MISSIONS_DATA na importação
+    from aggregates import build_cube
+    from charts import CHARTS, chart_name
+    from preprocess import build_snapshot, load_snapshot, snapshot_path, source_hash
+
+    secoes = {}
+    memoria = {}
+    figuras = {}
+
+    digest, secoes['source_hash'] = medir(source_hash, path)
+    if os.path.exists(snapshot_path(path, digest)):
+        os.remove(snapshot_path(path, digest))
+    _, secoes['build_snapshot'] = medir(build_snapshot, path, digest)
+    memoria['build_snapshot'] = max_rss()
+    df, secoes['load_data'] = medir(load_snapshot, path, digest)
+    memoria['load_data'] = max_rss()
+    cube, secoes['build_cube'] = medir(build_cube, df)
+    memoria['build_cube'] = max_rss()
+
+    for chart_id, builder, params in CHARTS:
+        nome = chart_name(chart_id, params)
+        fig, segundos = medir(builder, cube, **params)
+        figuras[nome] = {'seconds': segundos, 'payload_bytes': len(fig.to_json())}
+
+    memoria['figures'] = max_rss()
+    return {
+        'sections': secoes,
+        'max_rss_after_bytes': memoria,
+        'figures': figuras,
+        'cube_rows': len(cube),
+        'frame_bytes': int(df.memory_usage(deep=True).sum()),
+    }
+
+
+def bench_pages():
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(RAIZ, 'app.py'), default_timeout=600)
+    paginas = {}
+    for rodada in ('cold', 'warm'):
+        for pagina in PAGINAS:
+            at.switch_page(f'paginas/{pagina}.py')
+            _, segundos = medir(at.run)
+            if at.exception:
+                raise RuntimeError(f"{pagina}: {at.exception[0].message}")
+            graficos = at.get('plotly_chart')
+            paginas.setdefault(pagina, {})[rodada] = {
+                'seconds': segundos,
+                'charts': len(graficos),
+                'payload_bytes': sum(len(g.proto.spec) for g in graficos),
+            }
+    return paginas
+
+
+def worker(rows, path):
+    resultado = {'rows': rows}
+    resultado.update(bench_sections(path))
+    resultado['pages'] = bench_pages()
+    resultado['max_rss_bytes'] = max_rss()
+    return resultado
+
+
+def run_size(rows):
+    from synthetic import write
+
+    os.makedirs(DATA_DIR, exist_ok=True)
+    path = os.path.join(DATA_DIR, f'missions-{rows}.csv')
+    if not os.path.exists(path):
+        write(rows, path)
+
+    env = dict(os.environ, MISSIONS_DATA=path)
+    saida = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--worker', str(rows), path],
+        cwd=RAIZ, env=env, check=True, capture_output=True, text=True,
+    )
+    return json.loads(saida.stdout.strip().splitlines()[-1])
+
+
+def commit_atual():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=RAIZ,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def resumo(resultado, anterior=None):
+    antigos = {r['rows']: r for r in (anterior or {}).get('results', [])}
+    for r in resultado['results']:
+        print(f"\n{r['rows']:,} linhas (cubo: {r['cube_rows']:,} linhas, RSS máx. {r['max_rss_bytes'] / 2**20:.0f} MiB)")
+        velho = antigos.get(r['rows'])
+        linhas = [(nome, s) for nome, s in r['sections'].items()]
+        linhas += [(f"página {p} ({rodada})", v[rodada]['seconds'])
+                   for p, v in r['pages'].items() for rodada in ('cold', 'warm')]
+        for nome, segundos in linhas:
+            comparacao = ''
+            if velho:
+                if nome.startswith('página'):
+                    p, rodada = nome[7:].split(' (')
+                    antes = velho['pages'].get(p, {}).get(rodada.rstrip(')'), {}).get('seconds')
+                else:
+                    antes = velho['sections'].get(nome)
+                if antes:
+                    comparacao = f"  ({segundos / antes:.2f}x de {antes:.3f} s)"
+            print(f"  {nome:28s}{segundos:9.3f} s{comparacao}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=TAMANHOS)
+    parser.add_argument('--json', help='grava o resultado neste arquivo')
+    parser.add_argument('--compare', help='resultado anterior (JSON) para comparar')
+    parser.add_argument('--worker', nargs=2, metavar=('ROWS', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(int(args.worker[0]), args.worker[1])))
+        return
+
+    resultado = {
+        'commit': commit_atual(),
+        'python': sys.version.split()[0],
+        'results': [run_size(rows) for rows in args.rows],
+    }
+    anterior = None
+    if args.compare:
+        with open(args.compare) as f:
+            anterior = json.load(f)
+    resumo(resultado, anterior)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(resultado, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+import argparse
+import io
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from preprocess import CSV_DTYPES, DATA_PATH, REPLACE_DICT, clean_data  # noqa: E402
+
+# ------------------------------------
+# Benchmark da etapa de limpeza (load_data)
+#
+# Compara a limpeza original do app.py (três .str.split, pd.to_datetime sem
+# formato, .apply por linha, regex no custo) com preprocess.clean_data:
+# tempo de limpeza e memória do DataFrame resultante.
+#
+# Uso: python benchmarks/bench_parse.py [--rows 1000000] [--repeat 3] [--json saida.json]
+
+
+def legacy_clean(df):
+    # Limpeza como era feita em load_data() no app.py original
+    df = df.drop(columns=['Unnamed: 0', 'Unnamed: 0.1'])
+    df['Country'] = df['Location'].str.split(',').str[-1].str.strip()
+    df['Country'] = df['Country'].replace(REPLACE_DICT)
+    df['Datum'] = df['Datum'].str.split(' ').str[:4].str.join(' ')
+    df[['Weekday', 'Date']] = df['Datum'].str.split(' ', n=1, expand=True)
+    df.drop(columns=['Datum'], inplace=True)
+    df['Weekday'] = df['Weekday'].str.strip()
+    df['Date'] = df['Date'].str.strip()
+    df['Date'] = pd.to_datetime(df['Date'])
+    df['Mission Status'] = df['Status Mission'].apply(lambda x: 'Success' if x == 'Success' else 'Failure')
+    df.rename(columns={' Rocket': 'Mission Cost'}, inplace=True)
+    df['Mission Cost'] = pd.to_numeric(df['Mission Cost'].str.replace(r'[^\d.]', '', regex=True), errors='coerce')
+    df['Status Rocket'] = df['Status Rocket'].str.replace('Status', '', regex=False)
+    return df
+
+
+def scaled_csv(rows):
+    # Repete as linhas da amostra até chegar a 'rows' linhas
+    with open(DATA_PATH, 'rb') as f:
+        cabecalho, *linhas = f.read().splitlines(keepends=True)
+    vezes = -(-rows // len(linhas))
+    return cabecalho + b''.join((linhas * vezes)[:rows])
+
+
+def medir(funcao, bruto, repeat):
+    tempos = []
+    for _ in range(repeat):
+        df = pd.read_csv(io.BytesIO(bruto), dtype=CSV_DTYPES)
+        inicio = time.perf_counter()
+        limpo = funcao(df)
+        tempos.append(time.perf_counter() - inicio)
+    return {
+        'seconds': min(tempos),
+        'memory_bytes': int(limpo.memory_usage(deep=True).sum()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--json', help='grava o resultado neste arquivo')
+    args = parser.parse_args()
+
+    bruto = scaled_csv(args.rows)
+    resultado = {
+        'rows': args.rows,
+        'before': medir(legacy_clean, bruto, args.repeat),
+        'after': medir(clean_data, bruto, args.repeat),
+    }
+
+    for nome in ('before', 'after'):
+        r = resultado[nome]
+        print(f"{nome:>6}: {r['seconds']:8.3f} s  {r['memory_bytes'] / 2**20:8.1f} MiB")
+    print(f"speedup: {resultado['before']['seconds'] / resultado['after']['seconds']:.1f}x  "
+          f"memória: {resultado['after']['memory_bytes'] / resultado['before']['memory_bytes']:.0%}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(resultado, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+import argparse
+import itertools
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+# ------------------------------------
+# Verificação dos gráficos com filtros
+#
+# Filtros válidos da barra lateral podem deixar o recorte de um gráfico vazio
+# (ex.: um país sem nenhum sucesso no gráfico de sucessos por país) mesmo com
+# o cubo filtrado tendo linhas. Este script monta todos os gráficos do cubo
+# para cada valor de cada filtro (e cada ano, e cada combinação de status) e
+# depois roda as páginas pelo AppTest com combinações que já quebraram o app.
+# Sai com erro na primeira falha.
+#
+# Uso: python benchmarks/check_filters.py [--data data/space_missions.csv] [--no-pages]
+
+PAGINAS = ['pais', 'datas', 'empresa', 'missao', 'foguete', 'custo']
+
+# Filtros da barra lateral (chave do widget -> valores) que deixam gráficos
+# das páginas sem nada para mostrar
+CASOS_PAGINAS = [
+    {'filtro_Country': ['Brazil']},
+    {'filtro_Status Rocket': ['Retired']},
+    {'filtro_Mission Status': ['Failure'], 'filtro_Status Rocket': ['Active']},
+]
+
+
+def filter_combinations(indice):
+    # Um valor por coluna filtrável, cada ano e cada par de status
+    for coluna in indice.positions:
+        for valor in indice.options(coluna):
+            yield ((coluna, (valor,)),)
+    limites = indice.year_range()
+    for ano in range(limites[0], limites[1] + 1):
+        yield (('Year', (ano, ano)),)
+    for status, foguete in itertools.product(indice.options('Mission Status'), indice.options('Status Rocket')):
+        yield (('Mission Status', (status,)), ('Status Rocket', (foguete,)))
+
+
+def check_charts(dados):
+    from charts import CHARTS, chart_name, check_aggregated
+    from filters import CubeIndex
+
+    indice = CubeIndex(dados.cube)
+    total = 0
+    for filtros in filter_combinations(indice):
+        cube = indice.filter(dados.cube, filtros)
+        if cube.empty:
+            # O app mostra um aviso e não monta os gráficos (ver get_dataset)
+            continue
+        for chart_id, builder, params in CHARTS:
+            try:
+                check_aggregated(builder(cube, **params), chart_id)
+            except Exception as erro:
+                raise RuntimeError(f"{chart_name(chart_id, params)} com {filtros}: {erro!r}") from erro
+            total += 1
+    return total
+
+
+def check_pages():
+    from streamlit.testing.v1 import AppTest
+
+    for caso in CASOS_PAGINAS:
+        at = AppTest.from_file(os.path.join(RAIZ, 'app.py'), default_timeout=120)
+        at.run()
+        for chave, valores in caso.items():
+            at.multiselect(key=chave).set_value(valores)
+        for pagina in PAGINAS:
+            at.switch_page(f'paginas/{pagina}.py')
+            at.run()
+            if at.exception:
+                raise RuntimeError(f"{pagina} com {caso}: {at.exception[0].message}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--data', help='CSV de origem (padrão: MISSIONS_DATA ou data/space_missions.csv)')
+    parser.add_argument('--no-pages', action='store_true', help='só os gráficos, sem rodar as páginas')
+    args = parser.parse_args()
+    if args.data:
+        os.environ['MISSIONS_DATA'] = args.data
+
+    # Importado aqui: preprocess lê MISSIONS_DATA na importação
+    from incremental import make_loader
+
+    total = check_charts(make_loader(refresh_seconds=0).refresh())
+    print(f"{total} gráficos montados com filtros")
+    if not args.no_pages:
+        check_pages()
+        print(f"{len(CASOS_PAGINAS)} combinações de filtros em {len(PAGINAS)} páginas")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from preprocess import CSV_DTYPES  # noqa: E402
+
+# ------------------------------------
+# Geração de dados sintéticos de missões
+#
+# Gera um CSV com o mesmo esquema de data/space_missions.csv e o tamanho
+# pedido. As linhas são sorteadas (com reposição) da amostra real, o que
+# mantém as combinações empresa/local/foguete/custo/status; a data de cada
+# lançamento é deslocada aleatoriamente em até seis meses para espalhar os
+# lançamentos por mais dias.
+#
+# Uso: python benchmarks/synthetic.py 100000 saida.csv
+
+SAMPLE_PATH = os.path.join(RAIZ, 'data', 'space_missions.csv')
+
+DATUM_FORMAT = '%a %b %d, %Y %H:%M UTC'
+DATE_FORMAT = '%a %b %d, %Y'
+
+
+def generate(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    amostra = pd.read_csv(SAMPLE_PATH, dtype=CSV_DTYPES)
+    df = amostra.iloc[rng.integers(0, len(amostra), rows)].reset_index(drop=True)
+
+    # Mesmas colunas de índice do CSV original (exportado duas vezes com índice)
+    df['Unnamed: 0'] = np.arange(rows)
+    df['Unnamed: 0.1'] = np.arange(rows)
+
+    com_horario = df['Datum'].str.len() > 16
+    data = pd.to_datetime(df['Datum'].str[:16], format=DATE_FORMAT)
+    data = data + pd.to_timedelta(rng.integers(-180, 181, rows), unit='D')
+    # Mantém as datas dentro do período da amostra (Sputnik 1 até agosto de 2020)
+    data = data.where(data >= '1957-10-04', data + pd.Timedelta(days=181))
+    data = data.where(data < '2020-08-08', data - pd.Timedelta(days=181))
+    minutos = pd.to_timedelta(rng.integers(0, 24 * 60, rows), unit='min')
+    df['Datum'] = (data + minutos).dt.strftime(DATUM_FORMAT).where(com_horario, data.dt.strftime(DATE_FORMAT))
+
+    return df[list(amostra.columns)]
+
+
+def write(rows, path, seed=0):
+    df = generate(rows, seed)
+    # A primeira coluna do CSV original não tem nome no cabeçalho
+    df.rename(columns={'Unnamed: 0.1': ''}).to_csv(path, index=False)
+    return path
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('rows', type=int)
+    parser.add_argument('path')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    print(write(args.rows, args.path, args.seed))
@@ -0,0 +1,100 @@
+import threading
+import time
+from collections import OrderedDict
+
+# ------------------------------------
+# Cache em memória com tamanho máximo e descarte LRU
+#
+# Compartilhado entre as sessões do servidor (cada sessão roda em uma thread),
+# por isso todas as operações são protegidas por um lock.
+#
+# Opcionalmente:
+#   - ttl: segundos que um item vale depois de guardado; itens vencidos contam
+#     como ausentes e são descartados;
+#   - max_bytes: orçamento de memória. 'sizeof' dá o tamanho de cada valor e
+#     os itens menos usados são descartados até a soma caber no orçamento (um
+#     item maior que o orçamento inteiro não é guardado).
+
+
+class LRUCache:
+
+    def __init__(self, maxsize=128, ttl=None, max_bytes=None, sizeof=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        # chave -> (valor, tamanho, vencimento)
+        self._dados = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._dados)
+
+    def __contains__(self, key):
+        return key in self._dados
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._dados.get(key)
+            if item is not None and item[2] is not None and item[2] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                item = None
+            if item is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._dados.move_to_end(key)
+            return item[0]
+
+    def put(self, key, value):
+        tamanho = self.sizeof(value) if self.sizeof is not None else 0
+        vencimento = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._dados:
+                self._remove(key)
+            if self.max_bytes is not None and tamanho > self.max_bytes:
+                return
+            self._dados[key] = (value, tamanho, vencimento)
+            self.bytes += tamanho
+            while len(self._dados) > self.maxsize or (self.max_bytes is not None and self.bytes > self.max_bytes):
+                self._remove(next(iter(self._dados)))
+                self.evictions += 1
+
+    def get_or_build(self, key, build):
+        # O valor é construído fora do lock: duas sessões podem construir o
+        # mesmo item ao mesmo tempo, mas nenhuma fica bloqueada pela outra
+        valor = self.get(key, _AUSENTE)
+        if valor is _AUSENTE:
+            valor = build()
+            self.put(key, valor)
+        return valor
+
+    def clear(self):
+        with self._lock:
+            self._dados.clear()
+            self.bytes = 0
+
+    def stats(self):
+        return {
+            'size': len(self._dados),
+            'maxsize': self.maxsize,
+            'bytes': self.bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
+
+    def _remove(self, key):
+        _, tamanho, _ = self._dados.pop(key)
+        self.bytes -= tamanho
+
+
+_AUSENTE = object()
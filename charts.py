@@ -0,0 +1,387 @@
+import numpy as np
+import plotly.express as px
+
+from aggregates import cost_mean_by, counts_by, success_ratio_by_year, top_counts
+from reliability import GRUPOS
+from timeseries import STATUS, resolution_name
+
+# ------------------------------------
+# Construção dos gráficos do dashboard
+#
+# Cada função recebe o cubo de agregados e devolve a figura pronta. Os
+# gráficos não dependem da sessão do usuário, então o app guarda as figuras
+# em cache por (versão dos dados, gráfico, parâmetros).
+#
+# Os gráficos sempre recebem tabelas agregadas (categoria/contagem), nunca a
+# tabela de missões: o tamanho de cada figura deve depender do número de
+# categorias e não do número de linhas. check_aggregated() barra figuras que
+# fujam dessa regra.
+
+# Maior número de pontos aceito em uma figura. O maior gráfico atual (missões
+# por empresa) tem algumas dezenas de pontos; uma figura perto deste limite
+# quase certamente foi montada a partir das linhas da tabela.
+MAX_PONTOS = 2000
+
+
+# Propriedades de um trace que crescem com o número de pontos
+PROPRIEDADES = ['x', 'y', 'labels', 'values', 'ids', 'customdata', 'text']
+
+
+def figure_points(fig):
+    # Soma, para cada trace, o tamanho do maior array de dados (x, y, labels,
+    # values, ...), que é o que cresce no JSON enviado ao navegador. Lido dos
+    # traces e não do JSON: no Plotly 6 os arrays numéricos viram
+    # {'dtype', 'bdata'} no to_plotly_json()
+    total = 0
+    for trace in fig.data:
+        tamanhos = [len(trace[p]) for p in PROPRIEDADES
+                    if p in trace and trace[p] is not None and not isinstance(trace[p], str)]
+        total += max(tamanhos, default=0)
+    return total
+
+
+def chart_name(chart_id, params):
+    # Nome de um gráfico com seus parâmetros (ex.: 'custo_medio:Country'),
+    # usado nas métricas e nos arquivos exportados (ver export.py)
+    return ':'.join([chart_id, *map(str, params.values())])
+
+
+def check_aggregated(fig, chart_id, max_pontos=MAX_PONTOS):
+    pontos = figure_points(fig)
+    if pontos > max_pontos:
+        raise ValueError(
+            f"O gráfico '{chart_id}' tem {pontos} pontos (limite {max_pontos}); "
+            "agregue os dados antes de montar a figura"
+        )
+    return fig
+
+
+# Países
+def fig_missoes_pais(cube):
+    country_counts = top_counts(cube, 'Country').reset_index()
+    country_counts.columns = ['Country', 'Mission Count']
+
+    fig = px.bar(country_counts, x='Country', y='Mission Count', color='Mission Count',
+                text='Mission Count')
+    fig.update_layout(xaxis_title='País', yaxis_title='Número de Missões')
+    return fig
+
+
+# Ano
+def fig_lancamentos_ano(cube):
+    lancamentos_ano = counts_by(cube, 'Year')
+    fig_ano = px.bar(lancamentos_ano,
+                    x=lancamentos_ano.index,
+                    y=lancamentos_ano.values,
+                    labels={'x': 'Ano', 'y': 'Número de Lançamentos'})
+    fig_ano.update_layout(xaxis_title='Ano', yaxis_title='Número de Lançamentos')
+    # Separa as barras
+    fig_ano.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    fig_ano.update_xaxes(dtick="M12", tickformat="%Y")  # Formata o eixo x para mostrar apenas o ano
+    return fig_ano
+
+
+# Mês
+def fig_lancamentos_mes(cube):
+    lancamentos_mes = counts_by(cube, 'Month')
+    fig_mes = px.bar(lancamentos_mes,
+                    x=lancamentos_mes.index,
+                    y=lancamentos_mes.values,
+                    labels={'x': 'Mês', 'y': 'Número de Lançamentos'})
+    fig_mes.update_layout(xaxis_title='Mês', yaxis_title='Número de Lançamentos')
+    fig_mes.update_xaxes(tickvals=np.arange(1, 13),
+                         ticktext=['Jan', 'Fev', 'Mar', 'Abr', 'Mai', 'Jun',
+                                   'Jul', 'Ago', 'Set', 'Out', 'Nov', 'Dez'])
+    fig_mes.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig_mes
+
+
+# Dia da semana
+def fig_lancamentos_dia(cube):
+    lancamentos_dia = counts_by(cube, 'Weekday')
+    fig_dia = px.bar(lancamentos_dia,
+                    x=lancamentos_dia.index,
+                    y=lancamentos_dia.values,
+                    labels={'x': 'Dia da Semana', 'y': 'Número de Lançamentos'})
+    fig_dia.update_layout(xaxis_title='Dia da Semana', yaxis_title='Número de Lançamentos')
+    fig_dia.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    fig_dia.update_xaxes(tickvals=['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'],
+                        ticktext=['Seg', 'Ter', 'Qua', 'Qui', 'Sex', 'Sáb', 'Dom'])
+    fig_dia.update_xaxes(categoryorder='array', categoryarray=['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])
+    return fig_dia
+
+
+# Empresa
+def fig_missoes_empresa(cube):
+    company_counts = top_counts(cube, 'Company Name').reset_index()
+    company_counts.columns = ['Company Name', 'Mission Count']
+
+    fig = px.bar(company_counts, x='Company Name', y='Mission Count', color='Mission Count',
+                text='Mission Count')
+    fig.update_layout(xaxis_title='Empresa', yaxis_title='Número de Missões')
+    return fig
+
+
+# Pizza - Status das Missões
+def fig_status_missao(cube):
+    mission_status_counts = top_counts(cube, 'Mission Status').reset_index()
+    mission_status_counts.columns = ['Mission Status', 'Count']
+    fig = px.pie(mission_status_counts, values='Count', names='Mission Status')
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+# Razão de sucesso por ano
+def fig_razao_sucesso_ano(cube):
+    ano_sucesso = success_ratio_by_year(cube)
+    fig_sucesso_ano = px.line(
+        ano_sucesso,
+        x=ano_sucesso.index,
+        y='Success Ratio',
+        title='Razão de Sucesso das Missões Espaciais ao Longo dos Anos',
+        labels={'x': 'Ano', 'Year': 'Ano', 'Success Ratio': 'Razão de Sucesso'}
+    )
+    fig_sucesso_ano.update_layout(xaxis_title='Ano', yaxis_title='Taxa de Sucesso')
+    fig_sucesso_ano.update_traces(line=dict(color='blue', width=2))
+    return fig_sucesso_ano
+
+
+# Sucesso x fracasso por ano
+def fig_status_missao_ano(cube):
+    lancamentos_ano_status = (
+        counts_by(cube, ['Year', 'Mission Status'])
+        .reset_index(name='Quantidade')
+        .rename(columns={'Year': 'Ano'})
+    )
+    lancamentos_ano_status['Ano'] = lancamentos_ano_status['Ano'].astype(int)
+
+    # Gráfico de barras agrupadas por ano e status da missão com cores customizadas
+    color_map = {'Failure': 'red', 'Success': 'green'}
+    fig_status_missao = px.line(
+        lancamentos_ano_status,
+        x='Ano',
+        y='Quantidade',
+        color='Mission Status',
+        color_discrete_map=color_map,
+        markers=True,
+        labels={'Ano': 'Ano', 'Quantidade': 'Número de Lançamentos', 'Mission Status': 'Status da Missão'}
+    )
+    fig_status_missao.update_layout(
+        xaxis_title='Ano',
+        yaxis_title='Número de Lançamentos',
+        xaxis_tickangle=90,
+        xaxis=dict(tickmode='linear')
+    )
+    fig_status_missao.update_traces(line=dict(width=2), marker=dict(size=8, line=dict(width=1, color='DarkSlateGrey')))
+    return fig_status_missao
+
+
+# Top 10 Países com mais lançamentos bem-sucedidos
+def fig_sucesso_pais(cube):
+    # Tabela com colunas nomeadas: com filtros sem nenhum sucesso a série fica
+    # vazia, e o px.bar não aceita x/y vindos de uma série vazia
+    lancamentos_sucesso = (
+        top_counts(cube[cube['Mission Status'] == 'Success'], 'Country', 10)
+        .rename_axis('Country').reset_index(name='Count')
+    )
+    fig_sucesso_pais = px.bar(
+        lancamentos_sucesso,
+        x='Country',
+        y='Count',
+        labels={'Country': 'País', 'Count': 'Quantidade de Lançamentos Bem-Sucedidos'}
+    )
+    fig_sucesso_pais.update_layout(
+        xaxis_title='País',
+        yaxis_title='Quantidade de Lançamentos Bem-Sucedidos'
+    )
+    fig_sucesso_pais.update_traces(texttemplate='%{y}', textposition='outside')
+    fig_sucesso_pais.update_xaxes(tickangle=45)
+    fig_sucesso_pais.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig_sucesso_pais
+
+
+# Status das Missões por País
+def fig_pais_status(cube):
+    lancamentos_pais_status = counts_by(cube, ['Country', 'Mission Status']).reset_index(name='Quantidade')
+    lancamentos_pais_status = lancamentos_pais_status.sort_values(by='Quantidade', ascending=False)
+    lancamentos_pais_status = lancamentos_pais_status.head(10)
+
+    # Cria um gráfico de barras empilhadas para visualizar o status das missões por país
+    fig_pais_status = px.bar(
+        lancamentos_pais_status,
+        x='Country',
+        y='Quantidade',
+        color='Mission Status',
+        title='Status das Missões por País',
+        labels={'Country': 'País', 'Quantidade': 'Número de Lançamentos', 'Mission Status': 'Status da Missão'},
+        color_discrete_map={'Success': 'green', 'Failure': 'red'}
+    )
+    fig_pais_status.update_layout(
+        xaxis_title='País',
+        yaxis_title='Número de Lançamentos',
+        xaxis_tickangle=45,
+        barmode='stack'
+    )
+    fig_pais_status.update_traces(texttemplate='%{y}', textposition='outside')
+    fig_pais_status.update_xaxes(tickangle=45)
+    fig_pais_status.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig_pais_status
+
+
+# Pizza - Situação dos Foguetes
+def fig_status_foguete(cube):
+    # As contagens vêm prontas do cubo; passar a tabela linha a linha para o
+    # px.pie mandaria uma entrada por missão para o navegador contar
+    rocket_status_counts = counts_by(cube, 'Status Rocket').reset_index(name='Count')
+    fig_status_rocket = px.pie(
+        rocket_status_counts,
+        names='Status Rocket',
+        values='Count',
+        color='Status Rocket',
+        color_discrete_map={
+            'Active': 'blue',
+            'Retired': 'gray',
+            'Destroyed': 'red'
+        }
+    )
+    fig_status_rocket.update_traces(textposition='inside', textinfo='percent+label')
+    fig_status_rocket.update_layout(showlegend=False)
+    return fig_status_rocket
+
+
+# Top 10 Países com mais Foguetes Ativos / Aposentados
+def fig_foguetes_pais(cube, status):
+    titulo = {'Active': 'Número de Foguetes Ativos', 'Retired': 'Número de Foguetes Aposentados'}[status]
+    # Colunas nomeadas, como em fig_sucesso_pais: o recorte pode ficar vazio
+    foguetes_pais = (
+        top_counts(cube[cube['Status Rocket'] == status], 'Country', 10)
+        .rename_axis('Country').reset_index(name='Count')
+    )
+    fig = px.bar(
+        foguetes_pais,
+        x='Country',
+        y='Count',
+        labels={'Country': 'País', 'Count': titulo}
+    )
+    fig.update_layout(
+        xaxis_title='País',
+        yaxis_title=titulo,
+    )
+    fig.update_traces(texttemplate='%{y}', textposition='outside')
+    fig.update_xaxes(tickangle=45)
+    fig.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig
+
+
+# Custo Médio das Missões Espaciais por País / Empresa
+def fig_custo_medio(cube, coluna):
+    rotulo = {'Country': 'País', 'Company Name': 'Empresa'}[coluna]
+    custo_medio = cost_mean_by(cube, coluna).sort_values(ascending=False).head(10)
+    fig = px.bar(
+        custo_medio,
+        x=custo_medio.index,
+        y=custo_medio.values,
+        labels={'x': rotulo, 'y': 'Custo Médio da Missão (USD)'}
+    )
+    fig.update_layout(
+        xaxis_title=rotulo,
+        yaxis_title='Custo Médio da Missão (USD)',
+        yaxis_tickprefix='$',
+        yaxis_tickformat=','
+    )
+    fig.update_traces(texttemplate='%{y:.2f}', textposition='outside')
+    fig.update_xaxes(tickangle=45)
+    fig.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig
+
+
+# Cadência de lançamentos no período, na resolução escolhida (ver timeseries.py).
+# Recebe a pirâmide da série temporal em vez do cubo
+def fig_cadencia(piramide, resolucao, inicio, fim):
+    serie = piramide.series(resolucao, inicio, fim).rename_axis('Data').reset_index()
+    nome = resolution_name(resolucao)
+    fig = px.bar(
+        serie,
+        x='Data',
+        y=STATUS,
+        labels={'value': 'Número de Lançamentos', 'variable': 'Status da Missão'},
+        color_discrete_map={'Success': 'green', 'Failure': 'red'}
+    )
+    fig.update_layout(
+        xaxis_title=f'Data (por {nome.lower()})',
+        yaxis_title='Número de Lançamentos',
+        barmode='stack',
+        bargap=0
+    )
+    formato = {'D': '%d/%m/%Y', 'W': 'Semana de %d/%m/%Y', 'M': '%m/%Y', 'Y': '%Y'}[resolucao]
+    fig.update_xaxes(hoverformat=formato)
+    return fig
+
+
+# Confiabilidade dos grupos com mais lançamentos no período: taxa de sucesso
+# nos últimos N lançamentos com o intervalo de Wilson (ver reliability.py).
+# Recebe o ranking da confiabilidade em vez do cubo
+def fig_confiabilidade(ranking, coluna, ultimos, top=15):
+    rotulo = GRUPOS[coluna]
+    ranking = ranking.nlargest(top, 'Launches').sort_values('Last Rate').rename_axis('Grupo').reset_index()
+    ranking['Acima'] = ranking['Last High'] - ranking['Last Rate']
+    ranking['Abaixo'] = ranking['Last Rate'] - ranking['Last Low']
+    fig = px.bar(
+        ranking,
+        x='Last Rate',
+        y='Grupo',
+        orientation='h',
+        error_x='Acima',
+        error_x_minus='Abaixo',
+        hover_data={'Launches': True, 'Trailing Rate': ':.1%', 'Acima': False, 'Abaixo': False},
+        labels={'Grupo': rotulo, 'Last Rate': f'Sucesso nos últimos {ultimos} lançamentos',
+                'Launches': 'Lançamentos no período', 'Trailing Rate': 'Sucesso em 12 meses'}
+    )
+    fig.update_layout(xaxis_title=f'Taxa de sucesso nos últimos {ultimos} lançamentos', yaxis_title=rotulo,
+                      xaxis_tickformat='.0%', xaxis_range=[0, 1.05])
+    fig.update_traces(marker=dict(line=dict(width=1, color='DarkSlateGrey')))
+    return fig
+
+
+# Taxa de sucesso de um grupo ao longo do tempo nas duas janelas, com a faixa
+# do intervalo de Wilson dos últimos N lançamentos. Recebe a série do grupo
+# (já resumida para caber no limite de pontos)
+def fig_confiabilidade_serie(serie, coluna, ultimos, grupo):
+    fig = px.line(
+        serie,
+        x='Date',
+        y=['Last Rate', 'Trailing Rate'],
+        line_shape='hv',
+        labels={'Date': 'Data', 'value': 'Taxa de Sucesso', 'variable': 'Janela'}
+    )
+    nomes = {'Last Rate': f'Últimos {ultimos} lançamentos', 'Trailing Rate': 'Últimos 12 meses'}
+    fig.for_each_trace(lambda t: t.update(name=nomes[t.name]))
+    fig.add_scatter(x=serie['Date'], y=serie['Last High'], mode='lines', line=dict(width=0, shape='hv'),
+                    showlegend=False, hoverinfo='skip')
+    fig.add_scatter(x=serie['Date'], y=serie['Last Low'], mode='lines', line=dict(width=0, shape='hv'),
+                    fill='tonexty', fillcolor='rgba(99, 110, 250, 0.2)', name='Intervalo de Wilson (95%)',
+                    hoverinfo='skip')
+    fig.update_layout(title=f'{GRUPOS[coluna]}: {grupo}', xaxis_title='Data', yaxis_title='Taxa de Sucesso', yaxis_tickformat='.0%',
+                      yaxis_range=[0, 1.05])
+    return fig
+
+
+# Gráficos montados a partir do cubo: (id, função, parâmetros), na ordem das páginas
+CHARTS = [
+    ('missoes_pais', fig_missoes_pais, {}),
+    ('lancamentos_ano', fig_lancamentos_ano, {}),
+    ('lancamentos_mes', fig_lancamentos_mes, {}),
+    ('lancamentos_dia', fig_lancamentos_dia, {}),
+    ('missoes_empresa', fig_missoes_empresa, {}),
+    ('status_missao', fig_status_missao, {}),
+    ('razao_sucesso_ano', fig_razao_sucesso_ano, {}),
+    ('status_missao_ano', fig_status_missao_ano, {}),
+    ('sucesso_pais', fig_sucesso_pais, {}),
+    ('pais_status', fig_pais_status, {}),
+    ('status_foguete', fig_status_foguete, {}),
+    ('foguetes_pais', fig_foguetes_pais, {'status': 'Active'}),
+    ('foguetes_pais', fig_foguetes_pais, {'status': 'Retired'}),
+    ('custo_medio', fig_custo_medio, {'coluna': 'Country'}),
+    ('custo_medio', fig_custo_medio, {'coluna': 'Company Name'}),
+]
@@ -0,0 +1,222 @@
+import os
+import time
+
+import pandas as pd
+import plotly.io as pio
+import streamlit as st
+
+from cache import LRUCache
+from charts import chart_name, check_aggregated
+from export import ARTIFACTS_DIR, ArtifactLoader
+from filters import COLUNAS, CubeIndex, normalize_filters
+from incremental import BackgroundRefresher, make_loader
+from metrics import DEBUG, current_metrics
+from preprocess import DATA_PATH
+from reliability import Reliability, launches, row_filters
+from timeseries import Pyramid
+
+# ------------------------------------
+# Dados e gráficos compartilhados pelas páginas do dashboard
+#
+# Cada página em paginas/ roda sozinha (só a página aberta é executada), então
+# o carregamento dos dados e o cache de figuras ficam aqui, em um só lugar.
+
+# Carregamento dos dados
+# Um carregador por processo, compartilhado entre as sessões. Ele confere se o
+# CSV cresceu (ou, com vários arquivos, quais mudaram) e processa só o que é
+# novo, em uma thread separada: o rerun só pega a versão pronta mais recente
+# (ver incremental.py). Com MISSIONS_ARTIFACTS os dados vêm de uma exportação
+# (modo somente leitura, ver export.py)
+@st.cache_resource
+def get_loader():
+    if ARTIFACTS_DIR:
+        return ArtifactLoader(ARTIFACTS_DIR)
+    return make_loader(DATA_PATH)
+
+
+# Chamada uma vez por rerun, em app.py, antes da página
+def refresh_dataset():
+    with current_metrics().timer('load_data', kind='data') as entrada:
+        loader = get_loader()
+        anterior = loader.dataset
+        dados = loader.refresh()
+        entrada['cache'] = 'hit' if dados is anterior else 'miss'
+    return dados
+
+
+# Caches compartilhados entre as sessões, com limite de itens, de memória e
+# de tempo (ver cache.py). Configuráveis por variáveis de ambiente
+CACHE_TTL = float(os.environ.get("MISSIONS_CACHE_TTL", 600))
+CACHE_MAX_MB = float(os.environ.get("MISSIONS_CACHE_MAX_MB", 256))
+
+
+def nbytes(valor):
+    # Tamanho de um item do cache de filtros: tabelas filtradas, pirâmide ou
+    # confiabilidade
+    if isinstance(valor, tuple):
+        return sum(nbytes(v) for v in valor)
+    if isinstance(valor, (Pyramid, Reliability)):
+        return valor.nbytes
+    return int(valor.memory_usage(deep=True).sum())
+
+
+# Cubo e contagem diária filtrados (e a pirâmide da série temporal), por versão
+# dos dados e combinação de filtros. As mesmas combinações (ex.: EUA de 2000 a
+# 2020) se repetem entre sessões e páginas, e todos os gráficos de uma página
+# partem das mesmas tabelas filtradas
+@st.cache_resource
+def get_filter_cache():
+    return LRUCache(maxsize=256, ttl=CACHE_TTL, max_bytes=int(CACHE_MAX_MB * 2**20) // 2, sizeof=nbytes)
+
+
+# Índices dos filtros ('cube' ou 'daily'), montados uma vez por versão dos
+# dados. A tabela não entra na chave do cache (prefixo '_'): a versão e o nome
+# já a identificam
+@st.cache_resource(max_entries=4)
+def load_index(version, tabela, _dados):
+    return CubeIndex(_dados)
+
+
+# Dados da versão atual com os filtros da barra lateral aplicados
+def get_dataset():
+    dados = get_loader().dataset or refresh_dataset()
+    filtros = st.session_state.get('filtros', ())
+    if not filtros:
+        return dados
+
+    with current_metrics().timer('filter', kind='data') as entrada:
+        cache = get_filter_cache()
+        key = (dados.version, filtros)
+        item = cache.get(key)
+        entrada['cache'] = 'hit' if item is not None else 'miss'
+        if item is None:
+            item = tuple(
+                load_index(dados.version, tabela, getattr(dados, tabela)).filter(getattr(dados, tabela), filtros)
+                for tabela in ('cube', 'daily')
+            )
+            cache.put(key, item)
+    cube, daily = item
+    if cube.empty:
+        st.info("Nenhuma missão encontrada para os filtros selecionados.", icon=":material/filter_alt_off:")
+        st.stop()
+    return dados._replace(cube=cube, daily=daily, filters=filtros)
+
+
+# Pirâmide da série temporal dos dados (já filtrados), ver timeseries.py
+def get_pyramid(dados):
+    with current_metrics().timer('pyramid', kind='data') as entrada:
+        cache = get_filter_cache()
+        key = (dados.version, dados.filters, 'pyramid')
+        piramide = cache.get(key)
+        entrada['cache'] = 'hit' if piramide is not None else 'miss'
+        if piramide is None:
+            piramide = Pyramid(dados.daily)
+            cache.put(key, piramide)
+    return piramide
+
+
+# Confiabilidade em janelas móveis por grupo (ver reliability.py), por versão
+# dos dados e filtros de linhas; None quando a tabela de missões não está em
+# memória. O ano não entra na chave: ele só recorta o que é mostrado
+def get_reliability(dados, coluna, ultimos):
+    if dados.frame is None:
+        return None
+    with current_metrics().timer('reliability', kind='data') as entrada:
+        cache = get_filter_cache()
+        filtros = row_filters(dados.filters)
+        key = (dados.version, filtros, 'reliability', coluna, ultimos)
+        confiabilidade = cache.get(key)
+        entrada['cache'] = 'hit' if confiabilidade is not None else 'miss'
+        if confiabilidade is None:
+            confiabilidade = Reliability(launches(dados.frame, filtros), coluna, ultimos)
+            cache.put(key, confiabilidade)
+    return confiabilidade
+
+
+# Filtros da barra lateral, aplicados a todas as páginas
+ROTULOS_FILTROS = {
+    'Country': 'País',
+    'Company Name': 'Empresa',
+    'Mission Status': 'Status da Missão',
+    'Status Rocket': 'Situação do Foguete',
+}
+
+
+def sidebar_filters(dados):
+    indice = load_index(dados.version, 'cube', dados.cube)
+    limites = indice.year_range()
+    with st.sidebar.expander("Filtros", expanded=False, icon=":material/filter_alt:"):
+        anos = st.slider("Ano", *limites, value=limites, key='filtro_ano') if limites else None
+        colunas = {
+            coluna: st.multiselect(ROTULOS_FILTROS[coluna], indice.options(coluna), key=f'filtro_{coluna}')
+            for coluna in COLUNAS
+        }
+    st.session_state['filtros'] = normalize_filters(anos, limites, colunas)
+    if st.session_state['filtros']:
+        st.sidebar.caption("Os textos de análise descrevem o conjunto completo de missões, sem filtros.")
+
+
+# Cache de figuras compartilhado entre as sessões: os gráficos só mudam quando
+# os dados ou os filtros mudam, então cada figura é montada uma vez por versão
+# dos dados e combinação de filtros. O tamanho de cada item é o do JSON da
+# figura, que acompanha a memória ocupada por ela
+@st.cache_resource
+def get_figure_cache():
+    return LRUCache(maxsize=256, ttl=CACHE_TTL, max_bytes=int(CACHE_MAX_MB * 2**20) // 2, sizeof=lambda item: item[1])
+
+
+# No modo somente leitura, os gráficos sem filtros vêm prontos da exportação
+def prebuilt_spec(dados, nome):
+    loader = get_loader()
+    if dados.filters or not isinstance(loader, ArtifactLoader):
+        return None
+    return loader.figure_spec(dados.version, nome)
+
+
+# 'data' é o que o gráfico recebe no lugar do cubo (ex.: a pirâmide da série
+# temporal); deve ser determinado pela versão, pelos filtros e pelos parâmetros
+def plot(dados, chart_id, builder, data=None, **params):
+    key = (dados.version, dados.filters, chart_id, tuple(sorted(params.items())))
+    nome = chart_name(chart_id, params)
+    figuras = get_figure_cache()
+
+    with current_metrics().timer(nome, kind='chart') as entrada:
+        item = figuras.get(key)
+        entrada['cache'] = 'hit' if item is not None else 'miss'
+        if item is None:
+            spec = prebuilt_spec(dados, nome)
+            if spec is not None:
+                entrada['cache'] = 'artifact'
+                item = (pio.from_json(spec), len(spec))
+            else:
+                inicio = time.perf_counter()
+                fonte = dados.cube if data is None else data
+                fig = check_aggregated(builder(fonte, **params), chart_id)
+                entrada['build_seconds'] = time.perf_counter() - inicio
+                # O tamanho do JSON é medido uma vez e guardado junto com a figura
+                item = (fig, len(fig.to_json()))
+            figuras.put(key, item)
+        fig, entrada['payload_bytes'] = item
+        st.plotly_chart(fig, use_container_width=True)
+
+
+# Painel de depuração com as métricas do rerun (ver metrics.py)
+def debug_enabled():
+    return DEBUG or st.query_params.get('debug') == '1'
+
+
+def debug_panel(metricas):
+    with st.sidebar.expander("Métricas do rerun", expanded=True, icon=":material/speed:"):
+        st.caption(f"Página: {metricas.page} · {metricas.seconds * 1000:.1f} ms")
+        tabela = pd.DataFrame(metricas.entries)
+        tabela['ms'] = (tabela.pop('seconds') * 1000).round(2)
+        if 'build_seconds' in tabela:
+            tabela['build ms'] = (tabela.pop('build_seconds') * 1000).round(2)
+        st.dataframe(tabela, hide_index=True, use_container_width=True)
+        loader = get_loader()
+        if isinstance(loader, BackgroundRefresher) and loader.checked_at is not None:
+            st.caption(f"Dados verificados há {time.time() - loader.checked_at:.0f} s"
+                       + (f" · falha na última atualização: {loader.error}" if loader.error else ""))
+        st.caption(f"Cache de filtros: {get_filter_cache().stats()}")
+        st.caption(f"Cache de figuras: {get_figure_cache().stats()}")
+        st.code(metricas.to_prometheus(), language='text')
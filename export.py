@@ -0,0 +1,234 @@
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+
+import plotly.io as pio
+import pyarrow.feather as feather
+# Registra no Plotly o tema do Streamlit (pio.templates.default = "streamlit"),
+# o mesmo com que o app monta as figuras: o plotly.express resolve as cores do
+# tema na montagem, então as especificações exportadas precisam dele
+import streamlit  # noqa: F401
+
+import charts
+from incremental import Dataset, make_loader
+from preprocess import DATA_PATH
+from timeseries import Pyramid
+
+# ------------------------------------
+# Exportação do dashboard para arquivos estáticos
+#
+# Carrega os dados com a mesma limpeza do app, monta os agregados (cubo e
+# contagem diária) e todos os gráficos das páginas, sem filtros, e grava tudo
+# em um diretório:
+#
+#   saida/
+#     latest.json              -> {"version": ...}, a exportação atual
+#     <versão>/
+#       index.json             -> versão, origem, data e lista de gráficos
+#       cube.arrow, daily.arrow
+#       figures/<gráfico>.json -> especificação Plotly de cada gráfico
+#       html/<gráfico>.html    -> com --html, páginas prontas para publicar
+#
+# Cada exportação é gravada em um diretório temporário e só então passa a ser
+# a atual (troca do latest.json), então quem lê nunca vê uma exportação pela
+# metade. As figuras são montadas em paralelo em um pool de processos.
+#
+# Com MISSIONS_ARTIFACTS=saida o app roda em modo somente leitura: os dados
+# vêm da exportação (ArtifactLoader), sem ler o CSV, e os gráficos sem filtros
+# vêm prontos dos arquivos.
+#
+# Uso: python export.py [--data data/space_missions.csv] [--out export] [--workers N] [--html]
+
+ARTIFACTS_DIR = os.environ.get("MISSIONS_ARTIFACTS", "")
+PONTEIRO = 'latest.json'
+
+# Exportações anteriores mantidas no diretório (além da atual)
+MANTER = 2
+
+
+def page_charts(dados):
+    # Gráficos das páginas na visão inicial (sem filtros):
+    # (id, função, parâmetros, fonte dos dados)
+    graficos = [(chart_id, builder, params, 'cube') for chart_id, builder, params in charts.CHARTS]
+
+    # Cadência de lançamentos com o período inteiro e a resolução automática,
+    # como em paginas/datas.py
+    piramide = Pyramid(dados.daily)
+    inicio, fim = (d.date() for d in piramide.date_range())
+    params = {'resolucao': piramide.pick(inicio, fim), 'inicio': inicio, 'fim': fim}
+    graficos.append(('cadencia', charts.fig_cadencia, params, 'pyramid'))
+    return graficos, piramide
+
+
+# Dados dos gráficos em cada processo do pool, recebidos uma vez na criação
+_fontes = {}
+
+
+def _init_worker(cube, piramide):
+    _fontes.update(cube=cube, pyramid=piramide)
+
+
+@contextlib.contextmanager
+def _template(nome):
+    anterior = pio.templates.default
+    pio.templates.default = nome
+    try:
+        yield
+    finally:
+        pio.templates.default = anterior
+
+
+def render(chart_id, builder, params, fonte, html=False):
+    # Roda nos processos do pool, por isso fica no nível do módulo
+    fig = charts.check_aggregated(builder(_fontes[fonte], **params), chart_id)
+    pagina = None
+    if html:
+        # O tema do Streamlit só tem cores de referência, que o navegador do
+        # app substitui; a página avulsa é montada com o tema padrão do Plotly
+        with _template('plotly'):
+            pagina = pio.to_html(builder(_fontes[fonte], **params), include_plotlyjs='cdn')
+    return fig.to_json(), pagina
+
+
+def render_all(graficos, cube, piramide, workers=None, html=False):
+    argumentos = [(chart_id, builder, params, fonte, html) for chart_id, builder, params, fonte in graficos]
+    processos = min(len(argumentos), workers or os.cpu_count() or 1)
+    if processos <= 1:
+        _init_worker(cube, piramide)
+        return [render(*a) for a in argumentos]
+    with ProcessPoolExecutor(processos, mp_context=get_context('spawn'),
+                             initializer=_init_worker, initargs=(cube, piramide)) as pool:
+        return list(pool.map(render, *zip(*argumentos)))
+
+
+def export(path=DATA_PATH, out='export', workers=None, html=False):
+    dados = make_loader(path, refresh_seconds=0).refresh()
+    graficos, piramide = page_charts(dados)
+
+    inicio = time.perf_counter()
+    resultados = render_all(graficos, dados.cube, piramide, workers, html)
+    segundos = time.perf_counter() - inicio
+
+    destino = os.path.join(out, dados.version)
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    shutil.rmtree(temporario, ignore_errors=True)
+    os.makedirs(os.path.join(temporario, 'figures'))
+    if html:
+        os.makedirs(os.path.join(temporario, 'html'))
+
+    for tabela in ('cube', 'daily'):
+        feather.write_feather(getattr(dados, tabela), os.path.join(temporario, f'{tabela}.arrow'),
+                              compression='uncompressed')
+
+    lista = []
+    for (chart_id, _, params, _), (spec, pagina) in zip(graficos, resultados):
+        nome = charts.chart_name(chart_id, params)
+        arquivo = nome.replace(':', '__')
+        with open(os.path.join(temporario, 'figures', f'{arquivo}.json'), 'w') as f:
+            f.write(spec)
+        if pagina is not None:
+            with open(os.path.join(temporario, 'html', f'{arquivo}.html'), 'w') as f:
+                f.write(pagina)
+        lista.append({'name': nome, 'file': f'figures/{arquivo}.json', 'payload_bytes': len(spec)})
+
+    indice = {
+        'version': dados.version,
+        'source': path,
+        'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'render_seconds': segundos,
+        'charts': lista,
+    }
+    with open(os.path.join(temporario, 'index.json'), 'w') as f:
+        json.dump(indice, f, indent=2)
+
+    # Reexportar a mesma versão substitui a anterior
+    shutil.rmtree(destino, ignore_errors=True)
+    os.replace(temporario, destino)
+    _write_json(os.path.join(out, PONTEIRO), {'version': dados.version})
+    _prune(out, dados.version)
+    return destino, indice
+
+
+def _write_json(path, dados):
+    temporario = f"{path}.{os.getpid()}.tmp"
+    with open(temporario, 'w') as f:
+        json.dump(dados, f)
+    os.replace(temporario, path)
+
+
+def _prune(out, atual):
+    # Remove as exportações mais antigas, mantendo a atual e as MANTER últimas
+    anteriores = [
+        os.path.join(out, nome) for nome in os.listdir(out)
+        if nome != atual and not nome.endswith('.tmp') and os.path.isdir(os.path.join(out, nome))
+    ]
+    anteriores.sort(key=os.path.getmtime, reverse=True)
+    for pasta in anteriores[MANTER:]:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+
+class ArtifactLoader:
+    # Mesma interface dos carregadores de incremental.py, lendo uma exportação.
+    # A cada refresh() confere o latest.json e troca de versão quando uma nova
+    # exportação é publicada
+
+    def __init__(self, out=ARTIFACTS_DIR):
+        self.out = out
+        self.dataset = None
+        self.frame = None
+        self._pasta = None
+        self._figuras = {}
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        with self._lock:
+            with open(os.path.join(self.out, PONTEIRO)) as f:
+                versao = json.load(f)['version']
+            if self.dataset is not None and self.dataset.version == versao:
+                return self.dataset
+
+            pasta = os.path.join(self.out, versao)
+            with open(os.path.join(pasta, 'index.json')) as f:
+                indice = json.load(f)
+            cube, daily = (feather.read_feather(os.path.join(pasta, f'{t}.arrow')) for t in ('cube', 'daily'))
+
+            self._pasta = pasta
+            self._figuras = {g['name']: g['file'] for g in indice['charts']}
+            self.dataset = Dataset(versao, cube, daily)
+            return self.dataset
+
+    def figure_spec(self, version, nome):
+        # JSON pronto de um gráfico sem filtros, ou None se a exportação não o
+        # tiver (ou já tiver sido removida)
+        if self.dataset is None or version != self.dataset.version or nome not in self._figuras:
+            return None
+        try:
+            with open(os.path.join(self._pasta, self._figuras[nome])) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--data', default=DATA_PATH, help='CSV, diretório ou padrão glob de origem')
+    parser.add_argument('--out', default='export', help='diretório de saída')
+    parser.add_argument('--workers', type=int, help='processos para montar os gráficos (padrão: um por núcleo)')
+    parser.add_argument('--html', action='store_true', help='grava também uma página HTML por gráfico')
+    args = parser.parse_args()
+
+    destino, indice = export(args.data, args.out, args.workers, args.html)
+    total = sum(g['payload_bytes'] for g in indice['charts'])
+    print(f"{destino}: {len(indice['charts'])} gráficos ({total / 1024:.0f} KiB) "
+          f"em {indice['render_seconds']:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
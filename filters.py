@@ -0,0 +1,83 @@
+import numpy as np
+
+# ------------------------------------
+# Filtros do dashboard (ano, país, empresa, status)
+#
+# Os filtros são aplicados sobre o cubo de agregados, que já tem todas as
+# dimensões filtráveis. Para não varrer o cubo com uma máscara por gráfico, um
+# índice é montado uma vez por versão dos dados:
+#   - as linhas do cubo ordenadas por ano, com a posição onde cada ano começa;
+#   - para cada valor de cada coluna filtrável, as posições (ordenadas) das
+#     linhas do cubo com aquele valor.
+# Aplicar um filtro é então um recorte por ano mais a interseção das listas
+# de posições; os gráficos agregam só as linhas que sobram.
+
+COLUNAS = ['Country', 'Company Name', 'Mission Status', 'Status Rocket']
+
+# Dimensões que só o cubo tem (a contagem diária não): indexadas quando a
+# tabela as tem e aceitas pela API (ver api.py), mas fora da barra lateral
+COLUNAS_CUBO = ['Month', 'Weekday']
+
+
+def normalize_filters(anos=None, limites=None, colunas=None):
+    # Tupla ordenada e sem filtros vazios: a mesma seleção sempre gera a mesma
+    # chave (o que permite usá-la em caches). 'colunas' é um dict coluna ->
+    # valores escolhidos. Um intervalo de anos igual aos 'limites' dos dados
+    # não filtra nada e é descartado.
+    filtros = []
+    if anos is not None and tuple(anos) != tuple(limites or ()):
+        filtros.append(('Year', (int(anos[0]), int(anos[1]))))
+    for coluna, valores in sorted((colunas or {}).items()):
+        if valores:
+            filtros.append((coluna, tuple(sorted(valores))))
+    return tuple(filtros)
+
+
+class CubeIndex:
+
+    def __init__(self, cube):
+        anos = cube['Year'].to_numpy()
+        self.order = np.argsort(anos, kind='stable').astype(np.int64)
+        self.years = anos[self.order]
+        self.positions = {}
+        for coluna in COLUNAS + [c for c in COLUNAS_CUBO if c in cube]:
+            codigos, valores = _factorize(cube[coluna])
+            ordem = np.argsort(codigos, kind='stable')
+            inicios = np.searchsorted(codigos[ordem], np.arange(len(valores) + 1))
+            self.positions[coluna] = {
+                valor: ordem[inicios[i]:inicios[i + 1]]
+                for i, valor in enumerate(valores)
+            }
+
+    def options(self, coluna):
+        return sorted(self.positions[coluna])
+
+    def year_range(self):
+        if len(self.years) == 0:
+            return None
+        return int(self.years[0]), int(self.years[-1])
+
+    def select(self, filtros):
+        # Posições das linhas do cubo que passam em todos os filtros
+        selecao = None
+        for coluna, valor in filtros:
+            if coluna == 'Year':
+                inicio, fim = np.searchsorted(self.years, [valor[0], valor[1] + 1])
+                posicoes = np.sort(self.order[inicio:fim])
+            else:
+                vazio = np.empty(0, dtype=np.int64)
+                partes = [self.positions[coluna].get(v, vazio) for v in valor]
+                posicoes = np.sort(np.concatenate(partes)) if len(partes) > 1 else partes[0]
+            selecao = posicoes if selecao is None else np.intersect1d(selecao, posicoes, assume_unique=True)
+        return selecao
+
+    def filter(self, cube, filtros):
+        posicoes = self.select(filtros)
+        return cube if posicoes is None else cube.iloc[posicoes]
+
+
+def _factorize(serie):
+    # Códigos inteiros e valores distintos da coluna (NaN fica de fora)
+    codigos, valores = serie.factorize()
+    codigos = np.where(codigos >= 0, codigos, len(valores))
+    return codigos, list(valores)
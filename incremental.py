@@ -0,0 +1,311 @@
+import glob
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing import get_context
+
+import pandas as pd
+
+import shared
+from aggregates import build_aggregates, fold_aggregates, merge_aggregates, stream_aggregates
+from preprocess import (
+    CHUNK_SIZE, DATA_PATH, concat_frames, last_line_end, load_snapshot, open_range, read_chunks, source_files,
+    source_hash, update_hash
+)
+
+# ------------------------------------
+# Atualização incremental dos dados
+#
+# O CSV de missões é um log em que novos lançamentos são acrescentados no fim.
+# O carregador guarda até que byte do arquivo já foi processado e, a cada
+# atualização, limpa só as linhas novas e as soma ao cubo (contagens e
+# soma/quantidade de custo). O custo de uma atualização depende do tamanho do
+# trecho novo, não do histórico inteiro.
+#
+# Se o arquivo diminuir ou o trecho já processado mudar (o que não acontece em
+# um log só de acréscimos), os dados são recarregados do zero.
+#
+# Com MISSIONS_SHARED=1 cada versão é montada por um só processo do servidor e
+# compartilhada com os demais em memória compartilhada (ver shared.py).
+#
+# Com vários arquivos (um diretório ou padrão glob em MISSIONS_DATA, ver
+# MultiFileLoader), cada arquivo é limpo e agregado em um pool de processos e
+# as partes são juntadas; a cada atualização só os arquivos novos ou
+# alterados são relidos. O limite de leitura em blocos vale para a soma dos
+# arquivos: acima dele os processos do pool devolvem só os agregados e a
+# tabela de missões não é montada.
+#
+# O BackgroundRefresher tira a atualização do caminho das sessões: uma thread
+# confere a origem a cada poucos segundos e monta a nova versão ao lado da
+# atual. As sessões continuam usando a versão anterior até a nova ficar pronta,
+# quando ela é trocada de uma vez.
+
+# 'daily' é a contagem diária de lançamentos (ver aggregates.py), 'filters'
+# os filtros já aplicados ao cubo e à contagem diária (ver filters.py) e
+# 'frame' a tabela de missões da versão, sem filtros (None quando o arquivo é
+# lido em blocos)
+Dataset = namedtuple('Dataset', ['version', 'cube', 'daily', 'filters', 'frame'], defaults=[None, (), None])
+
+# A partir deste tamanho o CSV não é carregado inteiro: o cubo é montado lendo
+# o arquivo em blocos, sem materializar a tabela de missões
+STREAMING_MIN_BYTES = 256 * 1024 * 1024
+
+# Intervalo, em segundos, entre as verificações da origem em segundo plano
+# (MISSIONS_REFRESH_SECONDS); 0 atualiza a cada rerun, dentro da sessão
+REFRESH_SECONDS = float(os.environ.get("MISSIONS_REFRESH_SECONDS", 5))
+
+logger = logging.getLogger("missoes.refresh")
+
+# Quantos bytes do fim do trecho processado são comparados para detectar que
+# o arquivo foi reescrito em vez de apenas crescer
+TAIL_BYTES = 4096
+
+
+class IncrementalLoader:
+
+    def __init__(self, path=DATA_PATH, chunksize=CHUNK_SIZE, streaming_min_bytes=STREAMING_MIN_BYTES,
+                 shared=shared.SHARED):
+        self.path = path
+        self.chunksize = chunksize
+        self.streaming_min_bytes = streaming_min_bytes
+        self.shared = shared
+        # Versão atual (cubo + identificador); trocada de uma vez a cada
+        # atualização, então quem a leu continua com uma versão consistente
+        self.dataset = None
+        # Tabela de missões limpa; None quando o arquivo é lido em blocos
+        self.frame = None
+        self.offset = 0
+        # SHA-256 de [0, offset), atualizado com cada trecho acrescentado: a
+        # versão depende só dos bytes processados, então um carregador que
+        # acompanhou os acréscimos e um que leu o arquivo inteiro depois
+        # chegam à mesma versão (e, no modo compartilhado, ao mesmo bloco)
+        self._hash = None
+        self._colunas = None
+        self._cauda = None
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        with self._lock:
+            fim = last_line_end(self.path)
+            if self.dataset is None or fim < self.offset or self._tail(self.offset) != self._cauda:
+                self._rebuild(fim)
+            elif fim > self.offset:
+                self._append(fim)
+            return self.dataset
+
+    def _tail(self, offset):
+        with open_range(self.path, max(0, offset - TAIL_BYTES), offset) as f:
+            return f.read()
+
+    def _rebuild(self, fim):
+        self._colunas = list(pd.read_csv(self.path, nrows=0).columns)
+        digest = update_hash(hashlib.sha256(), self.path, 0, fim)
+
+        def montar():
+            if fim >= self.streaming_min_bytes:
+                return {'frame': None, **stream_aggregates(self.path, self.chunksize, fim=fim)}
+            frame = load_snapshot(self.path, digest.hexdigest()[:16], fim)
+            return {'frame': frame, **build_aggregates(frame)}
+
+        self._commit(montar, fim, digest)
+
+    def _append(self, fim):
+
+        # Um arquivo que cresceu além do limite passa a ser lido em blocos:
+        # a tabela é descartada e as linhas novas só entram no cubo
+        manter = self.frame is not None and fim < self.streaming_min_bytes
+
+        def montar():
+            novos = []
+
+            def blocos():
+                for bloco in read_chunks(self.path, self.chunksize, self.offset, fim, names=self._colunas):
+                    if manter:
+                        novos.append(bloco)
+                    yield bloco
+
+            agregados = fold_aggregates(blocos(), {'cube': self.dataset.cube, 'daily': self.dataset.daily})
+            if not manter:
+                return {'frame': None, **agregados}
+            frame = concat_frames([self.frame, *novos]) if novos else self.frame
+            return {'frame': frame, **agregados}
+
+        self._commit(montar, fim, update_hash(self._hash.copy(), self.path, self.offset, fim))
+
+    def _commit(self, montar, fim, digest):
+        versao = f"{digest.hexdigest()[:16]}-{fim}"
+        tabelas = _load_version(versao, montar, self.dataset, self.shared, self.path)
+        self.frame = tabelas['frame']
+        self._hash = digest
+        self.offset = fim
+        self._cauda = self._tail(fim)
+        self.dataset = Dataset(versao, tabelas['cube'], tabelas['daily'], frame=tabelas['frame'])
+
+
+class MultiFileLoader:
+
+    def __init__(self, path, chunksize=CHUNK_SIZE, streaming_min_bytes=STREAMING_MIN_BYTES, workers=None,
+                 shared=shared.SHARED):
+        self.path = path
+        self.chunksize = chunksize
+        self.streaming_min_bytes = streaming_min_bytes
+        # Processos do pool; None usa um por núcleo
+        self.workers = workers
+        self.shared = shared
+        self.dataset = None
+        self.frame = None
+        # Tamanho e data de modificação de cada arquivo na versão atual
+        self._assinaturas = None
+        # arquivo -> (assinatura, hash, fim, agregados) dos arquivos já processados
+        self._partes = {}
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        with self._lock:
+            assinaturas = {p: _signature(p) for p in source_files(self.path)}
+            if not assinaturas:
+                raise FileNotFoundError(f"nenhum CSV encontrado em {self.path}")
+            if self.dataset is not None and assinaturas == self._assinaturas:
+                return self.dataset
+
+            # A versão depende só do tamanho e da data dos arquivos, então
+            # todos os processos do servidor chegam à mesma versão sem ler nada
+            texto = json.dumps(sorted(assinaturas.items())).encode()
+            versao = 'files-' + hashlib.sha256(texto).hexdigest()[:16]
+            tabelas = _load_version(versao, lambda: self._build(assinaturas), self.dataset, self.shared, self.path)
+
+            self.frame = tabelas['frame']
+            self._assinaturas = assinaturas
+            self.dataset = Dataset(versao, tabelas['cube'], tabelas['daily'], frame=tabelas['frame'])
+            return self.dataset
+
+    def _build(self, assinaturas):
+        # O histórico é a soma dos arquivos: acima do limite nenhum deles
+        # volta como tabela, mesmo que cada um seja pequeno
+        em_blocos = sum(tamanho for tamanho, _ in assinaturas.values()) >= self.streaming_min_bytes
+        alterados = [p for p, a in assinaturas.items() if self._partes.get(p, (None,))[0] != a]
+        novos = dict(zip(alterados, self._load_files(alterados, em_blocos)))
+
+        partes = {}
+        frames = []
+        for arquivo, assinatura in assinaturas.items():
+            if arquivo in novos:
+                digest, fim, frame, agregados = novos[arquivo]
+            else:
+                _, digest, fim, agregados = self._partes[arquivo]
+                # Arquivo sem alteração: a tabela limpa vem do snapshot dele
+                frame = None if em_blocos else load_snapshot(arquivo, digest, fim)
+            partes[arquivo] = (assinatura, digest, fim, agregados)
+            frames.append(frame)
+        self._partes = partes
+
+        agregados = [a for _, _, _, a in partes.values()]
+        frame = None if em_blocos else concat_frames(frames)
+        return {'frame': frame, **(agregados[0] if len(agregados) == 1 else merge_aggregates(agregados))}
+
+    def _load_files(self, arquivos, em_blocos):
+        argumentos = (arquivos, repeat(self.chunksize), repeat(em_blocos))
+        processos = min(len(arquivos), self.workers or os.cpu_count() or 1)
+        if processos <= 1:
+            return list(map(load_file, *argumentos))
+        # 'spawn' em vez de 'fork': o servidor do Streamlit tem várias threads
+        # e um fork no meio delas pode herdar locks travados
+        with ProcessPoolExecutor(processos, mp_context=get_context('spawn')) as pool:
+            return list(pool.map(load_file, *argumentos))
+
+
+def load_file(path, chunksize=CHUNK_SIZE, streaming=False):
+    # Limpa e agrega um arquivo. Roda nos processos do pool, por isso fica no
+    # nível do módulo. Com 'streaming' o arquivo é lido em blocos e só os
+    # agregados voltam para o processo principal
+    fim = last_line_end(path)
+    digest = source_hash(path, fim)
+    if streaming:
+        return digest, fim, None, stream_aggregates(path, chunksize, fim=fim)
+    frame = load_snapshot(path, digest, fim)
+    return digest, fim, frame, build_aggregates(frame)
+
+
+class BackgroundRefresher:
+    # Mesma interface dos carregadores (refresh() e dataset), mas refresh()
+    # só devolve a versão pronta mais recente; quem atualiza é a thread
+
+    def __init__(self, loader, interval=REFRESH_SECONDS):
+        self.loader = loader
+        self.interval = interval
+        # Erro da última tentativa de atualização (a versão anterior continua
+        # valendo) e horário da última verificação bem-sucedida
+        self.error = None
+        self.checked_at = None
+        self._pronto = threading.Event()
+        self._parar = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='missoes-refresh', daemon=True)
+
+    @property
+    def dataset(self):
+        return self.loader.dataset
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._parar.set()
+        self._thread.join()
+
+    def refresh(self, timeout=None):
+        # Só a primeira carga espera pela thread; depois disso a sessão nunca
+        # fica bloqueada por uma atualização em andamento
+        self._pronto.wait(timeout)
+        if self.loader.dataset is None:
+            raise RuntimeError("não foi possível carregar os dados") from self.error
+        return self.loader.dataset
+
+    def _run(self):
+        while not self._parar.is_set():
+            try:
+                self.loader.refresh()
+                self.error = None
+                self.checked_at = time.time()
+            except Exception as erro:
+                self.error = erro
+                logger.exception("falha ao atualizar os dados de %s", self.loader.path)
+            # Libera a primeira carga também em caso de erro, que é então
+            # repassado por refresh()
+            self._pronto.set()
+            self._parar.wait(self.interval)
+
+
+def make_loader(path=DATA_PATH, refresh_seconds=REFRESH_SECONDS, **kwargs):
+    # Um CSV (atualizado de forma incremental) ou vários (diretório ou glob),
+    # atualizado em segundo plano se 'refresh_seconds' for maior que zero
+    if os.path.isdir(path) or glob.has_magic(path):
+        loader = MultiFileLoader(path, **kwargs)
+    else:
+        loader = IncrementalLoader(path, **kwargs)
+    if refresh_seconds > 0:
+        return BackgroundRefresher(loader, refresh_seconds).start()
+    return loader
+
+
+def _signature(path):
+    info = os.stat(path)
+    return info.st_size, info.st_mtime_ns
+
+
+def _load_version(versao, montar, anterior, compartilhado, origem):
+    # 'montar' devolve a tabela e o cubo da nova versão. No modo
+    # compartilhado ela só é chamada se nenhum outro processo já publicou
+    # essa versão
+    if not compartilhado:
+        return montar()
+    tabelas = shared.get_or_publish(versao, montar, os.path.abspath(origem))
+    if anterior is not None and anterior.version != versao:
+        shared.unlink(anterior.version)
+    return tabelas
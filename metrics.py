@@ -0,0 +1,102 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+# ------------------------------------
+# Instrumentação dos reruns
+#
+# Cada rerun do app registra, em um RunMetrics, o tempo de cada etapa
+# (carregamento dos dados, cada gráfico, a página inteira), o tamanho do JSON
+# de cada figura e se o cache foi usado. No fim do rerun as métricas podem:
+#   - aparecer no painel de depuração da barra lateral (?debug=1 na URL ou
+#     MISSIONS_DEBUG=1);
+#   - sair em uma linha de log por rerun, em JSON ou no formato texto do
+#     Prometheus (MISSIONS_METRICS=json ou MISSIONS_METRICS=prometheus).
+#
+# Cada rerun roda em uma thread própria do Streamlit, então o rerun atual é
+# guardado em uma variável por thread.
+
+METRICS_FORMAT = os.environ.get("MISSIONS_METRICS", "").lower()
+DEBUG = os.environ.get("MISSIONS_DEBUG", "") == "1"
+
+logger = logging.getLogger("missoes.metrics")
+if METRICS_FORMAT and not logger.handlers:
+    _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+_atual = threading.local()
+
+
+class RunMetrics:
+
+    def __init__(self, page=None):
+        self.page = page
+        self.entries = []
+        self._inicio = time.perf_counter()
+        self.seconds = None
+
+    @contextmanager
+    def timer(self, name, kind='section'):
+        # O bloco pode completar a entrada (cache, payload_bytes, ...)
+        entrada = {'name': name, 'kind': kind}
+        inicio = time.perf_counter()
+        try:
+            yield entrada
+        finally:
+            entrada['seconds'] = time.perf_counter() - inicio
+            self.entries.append(entrada)
+
+    def finish(self):
+        self.seconds = time.perf_counter() - self._inicio
+        return self
+
+    def to_dict(self):
+        return {'page': self.page, 'seconds': self.seconds, 'entries': self.entries}
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), default=str)
+
+    def to_prometheus(self):
+        linhas = [
+            '# TYPE missions_rerun_seconds gauge',
+            f'missions_rerun_seconds{{page="{self.page}"}} {self.seconds or 0:.6f}',
+            '# TYPE missions_section_seconds gauge',
+        ]
+        for e in self.entries:
+            rotulos = f'page="{self.page}",section="{e["name"]}",kind="{e["kind"]}",cache="{e.get("cache", "")}"'
+            linhas.append(f'missions_section_seconds{{{rotulos}}} {e["seconds"]:.6f}')
+        linhas.append('# TYPE missions_section_payload_bytes gauge')
+        for e in self.entries:
+            if 'payload_bytes' in e:
+                rotulos = f'page="{self.page}",section="{e["name"]}"'
+                linhas.append(f'missions_section_payload_bytes{{{rotulos}}} {e["payload_bytes"]}')
+        return '\n'.join(linhas)
+
+
+def start_run(page=None):
+    _atual.metrics = RunMetrics(page)
+    return _atual.metrics
+
+
+def current_metrics():
+    # Fora de um rerun (ex.: benchmarks) as medições vão para um registro
+    # descartável
+    metricas = getattr(_atual, 'metrics', None)
+    return metricas if metricas is not None else RunMetrics()
+
+
+def finish_run():
+    metricas = current_metrics().finish()
+    _atual.metrics = None
+    if METRICS_FORMAT == 'json':
+        logger.info(metricas.to_json())
+    elif METRICS_FORMAT == 'prometheus':
+        logger.info(metricas.to_prometheus())
+    return metricas
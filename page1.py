@@ -1,15 +0,0 @@
-import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-
-# Set page configuration
-st.set_page_config(
-    page_title="Missões Espaciais",
-    page_icon=":bar_chart:",
-    layout="wide"
-)
-
-# Página 1: 
\ No newline at end of file
@@ -0,0 +1,24 @@
+import streamlit as st
+
+import charts
+from dashboard import get_dataset, plot
+from textos import grafico14, grafico15
+
+dados = get_dataset()
+
+st.subheader("🤑 Custo Médio das Missões Espaciais por País")
+# Gráfico de barras com o custo médio por pais
+plot(dados, 'custo_medio', charts.fig_custo_medio, coluna='Country')
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico14}")
+
+
+st.markdown("---") 
+st.subheader("🤑 Custo Médio das Missões Espaciais por Empresa")
+
+# Gráfico de barras com o custo médio das missões espaciais por empresa
+plot(dados, 'custo_medio', charts.fig_custo_medio, coluna='Company Name')
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico15}")
@@ -0,0 +1,73 @@
+import streamlit as st
+
+import charts
+from aggregates import counts_by
+from dashboard import get_dataset, get_pyramid, plot
+from textos import grafico2, grafico3, grafico4
+from timeseries import resolution_name
+
+dados = get_dataset()
+cube = dados.cube
+
+st.subheader("📅 Missões espaciais por ano")
+
+col1, col2 = st.columns(2)
+with col1:
+    with st.container(border=True):
+        ano_maior_lancamentos = counts_by(cube, 'Year').idxmax()
+        st.metric(label="Maior quantidade de lançamentos", value=ano_maior_lancamentos)
+with col2:
+    with st.container(border=True):
+        ano_menor_lancamentos = counts_by(cube, 'Year').idxmin()
+        st.metric(label="Menor quantidade de lançamentos", value=ano_menor_lancamentos)
+
+# Gráfico com o número de lançamentos por ano, individualizando os anos
+plot(dados, 'lancamentos_ano', charts.fig_lancamentos_ano)
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico2}")
+
+
+st.markdown("---")
+st.subheader("📅 Missões espaciais por mês")
+
+# Gráfico com o número de lançamentos por mês, individualizando os meses
+plot(dados, 'lancamentos_mes', charts.fig_lancamentos_mes)
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico3}")
+
+
+st.markdown("---")
+st.subheader("📅 Missões espaciais por dia da semana")
+
+# Gráfico com o número de lançamentos por dia da semana, individualizando os dias
+plot(dados, 'lancamentos_dia', charts.fig_lancamentos_dia)
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico4}")
+
+
+st.markdown("---")
+st.subheader("📅 Cadência de lançamentos")
+
+# Série temporal por dia, semana, mês ou ano: a resolução mais fina em que o
+# período escolhido cabe no gráfico é usada por padrão (ver timeseries.py)
+piramide = get_pyramid(dados)
+primeiro, ultimo = (d.date() for d in piramide.date_range())
+if primeiro < ultimo:
+    inicio, fim = st.slider("Período", min_value=primeiro, max_value=ultimo, value=(primeiro, ultimo),
+                            format="DD/MM/YYYY")
+else:
+    inicio, fim = primeiro, ultimo
+
+opcoes = piramide.options(inicio, fim)
+automatica = opcoes[0]
+resolucao = st.segmented_control(
+    "Resolução", ['auto', *opcoes], default='auto',
+    format_func=lambda r: f"Automática ({resolution_name(automatica)})" if r == 'auto' else resolution_name(r)
+)
+if resolucao in (None, 'auto'):
+    resolucao = automatica
+
+plot(dados, 'cadencia', charts.fig_cadencia, data=piramide, resolucao=resolucao, inicio=inicio, fim=fim)
@@ -0,0 +1,15 @@
+import streamlit as st
+
+import charts
+from dashboard import get_dataset, plot
+from textos import grafico5
+
+dados = get_dataset()
+
+st.subheader("🏦 Missões Espaciais por Empresa")
+
+# Gráfico de barras com o número de missões por empresa
+plot(dados, 'missoes_empresa', charts.fig_missoes_empresa)
+
+with st.expander("Informações sobre as Empresas", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico5}")
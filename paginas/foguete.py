@@ -0,0 +1,35 @@
+import streamlit as st
+
+import charts
+from dashboard import get_dataset, plot
+from textos import grafico11, grafico12, grafico13
+
+dados = get_dataset()
+
+st.subheader("🚀 Situação dos Foguetes em 2020")
+
+# Gráfico de pizza com StatusRocket
+plot(dados, 'status_foguete', charts.fig_status_foguete)
+
+with st.expander("Informações sobre os Foguetes", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico11}")
+
+
+st.markdown("---")
+st.subheader("🚀 Top 10 Países com mais Foguetes Ativos em 2020")
+
+# Gráfico de barras com o número de foguetes ativos por país
+plot(dados, 'foguetes_pais', charts.fig_foguetes_pais, status='Active')
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico12}")
+
+
+st.markdown("---")
+st.subheader("🚀 Top 10 Países com mais Foguetes Aposentados em 2020")
+
+# Gráfico de barras com o número de foguetes aposentados por país
+plot(dados, 'foguetes_pais', charts.fig_foguetes_pais, status='Retired')
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico13}")
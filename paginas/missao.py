@@ -0,0 +1,111 @@
+import streamlit as st
+
+import charts
+from aggregates import success_ratio_by_year, top_counts
+from dashboard import get_dataset, get_reliability, plot
+from reliability import GRUPOS, ULTIMOS
+from textos import grafico6, grafico7, grafico8, grafico9, grafico10
+
+dados = get_dataset()
+cube = dados.cube
+
+st.subheader("⭐ Missões Espaciais por Status")
+
+status_counts = top_counts(cube, 'Mission Status')
+
+col1, col2 = st.columns(2)
+with col1:
+    with st.container(border=True):
+        st.metric(label="Missões com sucesso", value=status_counts.get('Success', 0))
+with col2:
+    with st.container(border=True):
+        st.metric(label="Missões com falha", value=status_counts.get('Failure', 0))
+# Gráfico de pizza
+plot(dados, 'status_missao', charts.fig_status_missao)
+
+with st.expander("Informações sobre o Status das Missões", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico6}")
+
+
+st.markdown("---")
+st.subheader("⭐ Razão de Sucesso das Missões Espaciais")
+
+# Razão de sucesso por ano, a partir do cubo (uma linha por ano)
+razao_ano = success_ratio_by_year(cube)['Success Ratio']
+
+col1, col2 = st.columns(2)
+with col1:
+    with st.container(border=True):
+        ano = razao_ano.idxmax()
+        st.metric(label="Ano com maior razão de sucesso", value=ano, delta=f"{razao_ano[ano]:.2%}")
+with col2:
+    with st.container(border=True):
+        ano = razao_ano.idxmin()
+        st.metric(label="Ano com menor razão de sucesso", value=ano, delta=f"-{razao_ano[ano]:.2%}")
+
+# Gráfico de linha com a taxa de sucesso ao longo dos anos
+plot(dados, 'razao_sucesso_ano', charts.fig_razao_sucesso_ano)
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico7}")
+
+
+st.markdown("---")
+st.subheader("⭐ Relação entre Lançamentos e Sucesso das Missões Espaciais")
+
+plot(dados, 'status_missao_ano', charts.fig_status_missao_ano)
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico8}")
+
+
+st.markdown("---")
+st.subheader("⭐ Top 10 Países com Mais Lançamentos Bem-Sucedidos")
+
+# Gráfico de barras com os 10 países com mais lançamentos bem-sucedidos
+plot(dados, 'sucesso_pais', charts.fig_sucesso_pais)
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico9}")
+
+
+st.markdown("---")
+st.subheader("⭐ Status das Missões Espaciais por País")
+
+# Gráfico de barras empilhadas com o status das missões por país
+plot(dados, 'pais_status', charts.fig_pais_status)
+
+with st.expander("Análise do Gráfico", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico10}")
+
+
+st.markdown("---")
+st.subheader("⭐ Confiabilidade em Janelas Móveis")
+
+# Taxa de sucesso nos últimos N lançamentos e nos últimos 12 meses de cada
+# país, empresa ou família de foguete, com o intervalo de confiança de Wilson
+# (ver reliability.py)
+col1, col2 = st.columns(2)
+with col1:
+    coluna = st.segmented_control("Agrupar por", list(GRUPOS), default='Company Name', format_func=GRUPOS.get)
+with col2:
+    ultimos = st.select_slider("Últimos N lançamentos", [5, 10, 20, 50, 100], value=ULTIMOS)
+coluna = coluna or 'Company Name'
+
+confiabilidade = get_reliability(dados, coluna, ultimos)
+if confiabilidade is None:
+    st.info("A confiabilidade em janelas móveis precisa da tabela de missões, que não fica em memória quando o "
+            "CSV é lido em blocos ou no modo somente leitura.", icon=":material/info:")
+else:
+    anos = dict(dados.filters).get('Year')
+    ranking = confiabilidade.ranking(anos)
+    plot(dados, 'confiabilidade', charts.fig_confiabilidade, data=ranking, coluna=coluna, ultimos=ultimos)
+
+    grupos = ranking.sort_values('Launches', ascending=False).index.tolist()
+    grupo = st.selectbox(GRUPOS[coluna], grupos)
+    # Quatro traços por ponto (duas janelas e os limites do intervalo)
+    serie = confiabilidade.series(grupo, anos, max_pontos=charts.MAX_PONTOS // 4)
+    plot(dados, 'confiabilidade_serie', charts.fig_confiabilidade_serie, data=serie,
+         coluna=coluna, ultimos=ultimos, grupo=grupo)
+    st.caption("O filtro de status da missão não se aplica aqui, e o de ano só recorta o período mostrado: as "
+               "janelas no começo do período incluem os lançamentos anteriores.")
@@ -0,0 +1,15 @@
+import streamlit as st
+
+import charts
+from dashboard import get_dataset, plot
+from textos import grafico1
+
+dados = get_dataset()
+
+st.subheader("🌎 Países com mais missões espaciais")
+
+# Gráfico de barras
+plot(dados, 'missoes_pais', charts.fig_missoes_pais)
+
+with st.expander("Informações sobre os Países", expanded=False, icon=":material/info:"):
+    st.caption(f"{grafico1}")
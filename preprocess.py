@@ -0,0 +1,331 @@
+import contextlib
+import glob
+import hashlib
+import io
+import os
+import re
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.feather as feather
+
+# ------------------------------------
+# Pré-processamento dos dados
+#
+# A limpeza do CSV é feita uma única vez e gravada em um snapshot colunar
+# (Arrow IPC / Feather sem compressão), identificado pelo hash do arquivo
+# de origem. Os processos do servidor leem o snapshot em vez de cada um
+# limpar o CSV. A leitura usa memory map, mas a conversão para pandas copia
+# as colunas para a memória do processo (os códigos das categóricas são
+# estreitados, as categorias remontadas e os nulos preenchidos), então cada
+# processo fica com a sua cópia da tabela; para uma cópia só entre os
+# processos, ver MISSIONS_SHARED em shared.py.
+#
+# Uso: python preprocess.py [caminho/do/arquivo.csv]
+
+# O caminho do CSV pode ser trocado pela variável de ambiente MISSIONS_DATA,
+# que também aceita um diretório ou um padrão glob com vários CSVs de mesmo
+# esquema (ver source_files)
+DATA_PATH = os.environ.get("MISSIONS_DATA", os.path.join("data", "space_missions.csv"))
+SNAPSHOT_DIR = os.path.join("data", "cache")
+
+# Ajusta nomes de países
+REPLACE_DICT = {
+    'Barents Sea': 'Russia',
+    'Gran Canaria': 'Spain',
+    'Shahrud Missile Test Site': 'Iran',
+    'Yellow Sea': 'Russia',
+    'Pacific Missile Range Facility': 'USA',
+    'Pacific Ocean': 'USA'
+}
+
+# Tipos das colunas do CSV de origem. Fixar 'str' evita que um bloco lido em
+# partes (ver read_chunks) seja inferido como numérico ou vazio e quebre a
+# limpeza com .str
+CSV_DTYPES = {
+    'Company Name': str,
+    'Location': str,
+    'Datum': str,
+    'Detail': str,
+    'Status Rocket': str,
+    ' Rocket': str,
+    'Status Mission': str,
+}
+
+# Formatos da coluna 'Datum', com e sem horário do lançamento
+DATUM_FORMAT = '%a %b %d, %Y %H:%M UTC'
+DATE_FORMAT = '%a %b %d, %Y'
+
+# Colunas categóricas e suas categorias (None: as que aparecerem nos dados).
+# Os textos repetidos (empresas, locais, foguetes, cargas) são guardados uma
+# vez por valor distinto, e cada linha guarda só um código inteiro. Listas
+# fixas só onde a ordem importa (dias da semana) ou os valores são criados
+# aqui ('Mission Status'): um valor fora da lista viraria NaN em silêncio
+CATEGORIAS = {
+    'Company Name': None,
+    'Location': None,
+    'Rocket Name': None,
+    'Payload': None,
+    'Status Mission': None,
+    'Country': None,
+    'Weekday': ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'],
+    'Status Rocket': None,
+    'Mission Status': ['Failure', 'Success'],
+}
+
+# Tamanho padrão dos blocos na leitura em partes
+CHUNK_SIZE = 100_000
+
+# Esquema do DataFrame limpo gravado no snapshot
+SCHEMA = pa.schema([
+    ('Company Name', pa.dictionary(pa.int32(), pa.string())),
+    ('Location', pa.dictionary(pa.int32(), pa.string())),
+    ('Rocket Name', pa.dictionary(pa.int32(), pa.string())),
+    ('Payload', pa.dictionary(pa.int32(), pa.string())),
+    ('Status Rocket', pa.dictionary(pa.int8(), pa.string())),
+    ('Mission Cost', pa.float64()),
+    ('Status Mission', pa.dictionary(pa.int8(), pa.string())),
+    ('Country', pa.dictionary(pa.int32(), pa.string())),
+    ('Weekday', pa.dictionary(pa.int8(), pa.string())),
+    ('Date', pa.timestamp('us')),
+    ('Launch Time', pa.timestamp('us', tz='UTC')),
+    ('Mission Status', pa.dictionary(pa.int8(), pa.string())),
+])
+
+
+def _strptime(texto, formato):
+    # strptime do Arrow (C++), bem mais rápido que o do pandas com %a/%b;
+    # textos fora do formato viram NaT (ver a verificação em clean_data)
+    datas = pc.strptime(pa.array(texto, type=pa.string()), format=formato, unit='us', error_is_null=True)
+    return pd.Series(datas.to_numpy(zero_copy_only=False), index=texto.index)
+
+
+def map_categories(serie, funcao):
+    # Aplica 'funcao' aos valores distintos de uma coluna categórica (uma vez
+    # por valor, não por linha) e monta a nova coluna categórica a partir dos
+    # códigos. Linhas vazias (código -1) continuam vazias
+    novos = pd.Categorical(funcao(serie.cat.categories))
+    mapa = np.append(novos.codes, -1)
+    codigos = mapa[serie.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codigos, dtype=novos.dtype), index=serie.index)
+
+
+def clean_data(df):
+    # Remove colunas desnecessárias
+    df = df.drop(columns=['Unnamed: 0', 'Unnamed: 0.1'])
+    # Textos repetidos viram 'category' logo no início: as colunas derivadas
+    # deles são calculadas por valor distinto
+    for coluna in ['Company Name', 'Location', 'Detail', 'Status Rocket', 'Status Mission']:
+        df[coluna] = df[coluna].astype('category')
+    # Cria a coluna 'Country' (algumas centenas de locais distintos)
+    df['Country'] = map_categories(
+        df['Location'],
+        lambda locais: locais.str.rsplit(',', n=1).str[-1].str.strip().map(lambda p: REPLACE_DICT.get(p, p))
+    )
+    # Separa 'Detail' ("Falcon 9 Block 5 | Starlink V1 L9") em foguete e carga
+    detalhe = df.pop('Detail')
+    df['Rocket Name'] = map_categories(detalhe, lambda d: d.str.split(' | ', n=1, regex=False).str[0].str.strip())
+    df['Payload'] = map_categories(detalhe, lambda d: d.str.split(' | ', n=1, regex=False).str[1].str.strip())
+    # Processa a coluna 'Datum' ("Fri Aug 07, 2020 05:12 UTC"; alguns
+    # lançamentos não têm horário: "Fri Aug 07, 2020")
+    datum = df.pop('Datum')
+    df['Weekday'] = datum.str[:3]
+    lancamento = _strptime(datum, DATUM_FORMAT)
+    df['Date'] = lancamento.dt.normalize()
+    sem_horario = lancamento.isna()
+    if sem_horario.any():
+        df.loc[sem_horario, 'Date'] = _strptime(datum[sem_horario], DATE_FORMAT)
+    # Uma data fora dos dois formatos não vira NaT em silêncio (o ano do cubo
+    # ficaria NaN): a limpeza falha e a versão anterior dos dados continua
+    # valendo até a origem ser corrigida
+    invalidas = df['Date'].isna()
+    if invalidas.any():
+        exemplos = ', '.join(f"linha {i}: {d!r}" for i, d in datum[invalidas].head(5).items())
+        raise ValueError(f"{int(invalidas.sum())} data(s) fora dos formatos {DATUM_FORMAT!r} e {DATE_FORMAT!r} ({exemplos})")
+    df['Launch Time'] = lancamento.dt.tz_localize('UTC')
+    # Cria a coluna 'Mission Status' para categorizar as missões
+    df['Mission Status'] = np.where(df['Status Mission'] == 'Success', 'Success', 'Failure')
+    # Renomeia a coluna ' Rocket' para 'Mission Cost'
+    df.rename(columns={' Rocket': 'Mission Cost'}, inplace=True)
+    # Converte a coluna 'Mission Cost' para numérica ("5,000.0 " -> 5000.0)
+    df['Mission Cost'] = pd.to_numeric(df['Mission Cost'].str.replace(',', '', regex=False).str.strip(), errors='coerce')
+    # Em StatusRocket, remover a palavra Status
+    df['Status Rocket'] = map_categories(df['Status Rocket'], lambda s: s.str.removeprefix('Status'))
+    # Colunas com poucos valores distintos ficam como 'category'
+    for coluna, categorias in CATEGORIAS.items():
+        df[coluna] = df[coluna].astype(pd.CategoricalDtype(categorias))
+
+    return df[SCHEMA.names]
+
+
+def concat_frames(frames):
+    # Junta partes da tabela limpa (ou do cubo) mantendo as colunas
+    # categóricas. Quando as categorias das partes diferem, o pd.concat
+    # converteria a coluna para texto; em vez disso cada parte passa a usar a
+    # união das categorias (só os códigos são remapeados) e o concat junta os
+    # códigos. Sem lista fixa, a união fica em ordem alfabética, como em uma
+    # limpeza completa
+    partes = list(frames)
+    for coluna in partes[0].columns:
+        tipos = [parte[coluna].dtype for parte in partes]
+        if not isinstance(tipos[0], pd.CategoricalDtype):
+            continue
+        if all(list(t.categories) == list(tipos[0].categories) for t in tipos[1:]):
+            continue
+        categorias = tipos[0].categories.append([t.categories for t in tipos[1:]]).unique()
+        if CATEGORIAS.get(coluna, None) is None:
+            categorias = categorias.sort_values()
+        tipo = pd.CategoricalDtype(categorias, ordered=tipos[0].ordered)
+        partes = [parte.assign(**{coluna: parte[coluna].astype(tipo)}) for parte in partes]
+    return pd.concat(partes, ignore_index=True)
+
+
+class _Trecho(io.RawIOBase):
+    # Arquivo somente leitura restrito ao intervalo [inicio, fim) de outro
+    # arquivo, para que o pandas leia só uma parte do CSV
+
+    def __init__(self, path, inicio=0, fim=None):
+        self._f = open(path, 'rb')
+        self._f.seek(inicio)
+        self._restante = (os.path.getsize(path) if fim is None else fim) - inicio
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        n = min(len(b), self._restante)
+        if n <= 0:
+            return 0
+        lido = self._f.readinto(memoryview(b)[:n])
+        self._restante -= lido
+        return lido
+
+    def close(self):
+        self._f.close()
+        super().close()
+
+
+def open_range(path, inicio=0, fim=None):
+    return io.BufferedReader(_Trecho(path, inicio, fim))
+
+
+def last_line_end(path):
+    # Posição logo após a última quebra de linha do arquivo. Uma linha que
+    # ainda está sendo escrita no fim do arquivo fica para a próxima leitura
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0:
+            inicio = max(0, pos - (1 << 16))
+            f.seek(inicio)
+            i = f.read(pos - inicio).rfind(b'\n')
+            if i >= 0:
+                return inicio + i + 1
+            pos = inicio
+    return 0
+
+
+def read_csv_range(path, inicio=0, fim=None, names=None, **kwargs):
+    # Lê o trecho [inicio, fim) do CSV. Um trecho que não começa no início do
+    # arquivo não tem cabeçalho, então os nomes das colunas vêm em 'names'
+    if names is not None:
+        kwargs.update(header=None, names=names)
+    return pd.read_csv(open_range(path, inicio, fim), dtype=CSV_DTYPES, **kwargs)
+
+
+def read_chunks(path=DATA_PATH, chunksize=CHUNK_SIZE, inicio=0, fim=None, names=None):
+    # Lê e limpa o CSV bloco a bloco; a limpeza é feita linha a linha, então
+    # cada bloco limpo é igual ao trecho correspondente da tabela completa
+    with read_csv_range(path, inicio, fim, names, chunksize=chunksize) as leitor:
+        for bloco in leitor:
+            yield clean_data(bloco)
+
+
+def source_files(path=DATA_PATH):
+    # Arquivos de origem: o próprio CSV, todos os .csv de um diretório ou os
+    # arquivos de um padrão glob (ex.: data/missoes-*.csv), em ordem
+    if os.path.isdir(path):
+        return sorted(glob.glob(os.path.join(path, '*.csv')))
+    if glob.has_magic(path):
+        return sorted(p for p in glob.glob(path) if os.path.isfile(p))
+    return [path]
+
+
+def update_hash(digest, path, inicio=0, fim=None):
+    # Acrescenta ao hash o trecho [inicio, fim) do arquivo, lido em blocos
+    # para não carregar tudo na memória
+    with open_range(path, inicio, fim) as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            digest.update(bloco)
+    return digest
+
+
+def source_hash(path, fim=None):
+    # Hash do arquivo de origem (ou dos seus primeiros 'fim' bytes)
+    return update_hash(hashlib.sha256(), path, 0, fim).hexdigest()[:16]
+
+
+def snapshot_path(path, digest):
+    nome = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(SNAPSHOT_DIR, f"{nome}-{digest}.arrow")
+
+
+def build_snapshot(path=DATA_PATH, digest=None, fim=None):
+    # Com 'fim', o snapshot cobre só os primeiros 'fim' bytes do CSV (as
+    # linhas acrescentadas depois são lidas à parte, ver incremental.py)
+    digest = digest or source_hash(path, fim)
+    destino = snapshot_path(path, digest)
+
+    df = clean_data(read_csv_range(path, 0, fim))
+    table = pa.Table.from_pandas(df, schema=SCHEMA, preserve_index=False)
+
+    # Grava em um arquivo temporário e renomeia, para que outro processo
+    # nunca leia um snapshot pela metade
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    feather.write_feather(table, temporario, compression='uncompressed')
+    os.replace(temporario, destino)
+    prune_snapshots(path, digest)
+    return destino
+
+
+def prune_snapshots(path, digest):
+    # Remove os snapshots do mesmo CSV com outro hash: cada recarga de um
+    # arquivo que só cresce gravaria mais uma cópia do histórico inteiro.
+    # Um processo que ainda lê o snapshot antigo pelo memory map continua com
+    # acesso (ver load_snapshot para quem ainda ia abri-lo)
+    nome = os.path.splitext(os.path.basename(path))[0]
+    padrao = re.compile(re.escape(nome) + r'-[0-9a-f]+\.arrow')
+    for arquivo in os.listdir(SNAPSHOT_DIR):
+        if padrao.fullmatch(arquivo) and arquivo != os.path.basename(snapshot_path(path, digest)):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(os.path.join(SNAPSHOT_DIR, arquivo))
+
+
+def load_snapshot(path=DATA_PATH, digest=None, fim=None):
+    digest = digest or source_hash(path, fim)
+    destino = snapshot_path(path, digest)
+    if not os.path.exists(destino):
+        build_snapshot(path, digest, fim)
+
+    # O memory map evita ler o arquivo para buffers intermediários; o
+    # to_pandas() no fim copia as colunas
+    try:
+        table = feather.read_table(destino, memory_map=True)
+    except FileNotFoundError:
+        # Removido por outro processo que gravou uma versão mais nova
+        build_snapshot(path, digest, fim)
+        table = feather.read_table(destino, memory_map=True)
+    # Snapshot gravado com outro esquema (versão antiga do código): refaz
+    if not table.schema.equals(SCHEMA, check_metadata=False):
+        build_snapshot(path, digest, fim)
+        table = feather.read_table(destino, memory_map=True)
+    return table.to_pandas()
+
+
+if __name__ == "__main__":
+    import sys
+
+    origem = sys.argv[1] if len(sys.argv) > 1 else DATA_PATH
+    print(build_snapshot(origem))
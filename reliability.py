@@ -0,0 +1,243 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from preprocess import map_categories
+
+# ------------------------------------
+# Confiabilidade dos lançamentos em janelas móveis
+#
+# A razão de sucesso por ano (ver aggregates.py) só olha o ano do calendário.
+# Aqui a taxa de sucesso de cada país, empresa ou família de foguete é
+# acompanhada lançamento a lançamento, em duas janelas:
+#   - os últimos N lançamentos do grupo;
+#   - os lançamentos do grupo nos últimos 12 meses (DIAS).
+#
+# Tudo sai de uma passada vetorizada: os lançamentos são ordenados por grupo
+# (mantendo a ordem de data) e as somas acumuladas de lançamentos e sucessos
+# dão o total de cada janela como a diferença entre duas posições. O início da
+# janela de N lançamentos é a posição menos N (sem passar do início do grupo);
+# o da janela de 12 meses vem de uma busca binária em uma chave grupo/dia.
+#
+# Cada taxa vem com o intervalo de confiança de Wilson, que continua
+# informativo com poucos lançamentos (um grupo com 2 de 2 sucessos não tem
+# confiabilidade de 100%).
+#
+# A tabela precisa das linhas de lançamento, então só existe quando a tabela
+# de missões está em memória (não quando o CSV é lido em blocos nem no modo
+# somente leitura).
+
+# Coluna da tabela de lançamentos -> rótulo
+GRUPOS = {
+    'Country': 'País',
+    'Company Name': 'Empresa',
+    'Rocket Family': 'Família de foguete',
+}
+
+# Janelas padrão: últimos N lançamentos e últimos DIAS dias
+ULTIMOS = 20
+DIAS = 365
+
+# 95% de confiança
+Z = 1.96
+
+# Janelas e colunas de cada uma na tabela
+JANELAS = ['Last', 'Trailing']
+
+# Períodos do pandas usados para resumir uma série longa, do mais fino ao
+# mais grosso (ver sample)
+PERIODOS = ['D', 'W', 'M', 'Q', 'Y']
+
+
+# Famílias que a regra de rocket_family não separa ou não junta direito,
+# pelo começo do nome (o prefixo mais longo vale): o ônibus espacial tem um
+# nome por orbitador, o Falcon 1 e o Falcon 9 são foguetes diferentes, e a
+# série H japonesa usa numerais romanos presos ao nome ("H-IIA")
+FAMILIAS = {
+    'Space Shuttle': 'Space Shuttle',
+    'Falcon 1': 'Falcon 1',
+    'Falcon 9': 'Falcon 9',
+    'H-I': 'H-I',
+    'H-II': 'H-II',
+    'SM-65': 'Atlas',
+    'Commercial Titan': 'Titan',
+    'Blue Scout': 'Scout',
+    'Mercury-Redstone': 'Redstone',
+    'Redstone': 'Redstone',
+}
+
+# Palavras que indicam uma variante do foguete, e não parte do nome da
+# família: numerais romanos e siglas curtas ("Atlas IIAS", "Proton K",
+# "Soyuz FG", "Pegasus XL", "GSLV Mk III")
+VARIANTE = re.compile(r'[A-Z]{1,4}\+?|Mk|Demo')
+
+
+def rocket_family(nome):
+    # Família de um foguete: o nome até a primeira variante (número, numeral
+    # romano ou sigla), exceto os casos de FAMILIAS ("Atlas V 401" -> "Atlas",
+    # "Long March 2D" -> "Long March", "Soyuz ST-A/Fregat" -> "Soyuz",
+    # "Proton K/Block D" -> "Proton", "Space Shuttle Columbia" -> "Space
+    # Shuttle")
+    for prefixo in sorted(FAMILIAS, key=len, reverse=True):
+        if nome.startswith(prefixo):
+            return FAMILIAS[prefixo]
+    base = re.split(r'[-/(]', nome, maxsplit=1)[0].strip()
+    palavras = []
+    for palavra in base.split():
+        if any(c.isdigit() for c in palavra) or (palavras and VARIANTE.fullmatch(palavra)):
+            break
+        palavras.append(palavra)
+    return ' '.join(palavras) or base or nome
+
+
+def row_filters(filtros):
+    # Filtros aplicados às linhas antes das janelas. O ano só recorta o que é
+    # mostrado (a janela no começo do período inclui os lançamentos
+    # anteriores) e o status da missão é justamente o que é medido
+    return tuple((coluna, valor) for coluna, valor in filtros if coluna not in ('Year', 'Mission Status'))
+
+
+def launches(frame, filtros=()):
+    # Tabela enxuta de lançamentos em ordem de data (e horário, quando há):
+    # grupos, dia e sucesso
+    mascara = np.ones(len(frame), dtype=bool)
+    for coluna, valores in row_filters(filtros):
+        mascara &= frame[coluna].isin(valores).to_numpy()
+    frame = frame[mascara] if not mascara.all() else frame
+
+    datas = frame['Date'].to_numpy()
+    # Lançamentos sem horário (NaT, o menor valor) ficam no início do dia
+    horario = frame['Launch Time'].array.tz_localize(None).asi8
+    ordem = np.lexsort((horario, datas))
+
+    tabela = pd.DataFrame({
+        'Date': datas[ordem],
+        'Country': frame['Country'].array.take(ordem),
+        'Company Name': frame['Company Name'].array.take(ordem),
+        'Rocket Family': map_categories(frame['Rocket Name'], lambda nomes: nomes.map(rocket_family)).array.take(ordem),
+        'Success': (frame['Mission Status'] == 'Success').to_numpy()[ordem],
+    })
+    return tabela
+
+
+def sample(serie, max_pontos):
+    # Situação no último lançamento de cada período, no período mais fino em
+    # que a série cabe em 'max_pontos' linhas
+    if len(serie) <= max_pontos:
+        return serie
+    for periodo in PERIODOS:
+        chaves = serie['Date'].dt.to_period(periodo)
+        if chaves.nunique() <= max_pontos or periodo == PERIODOS[-1]:
+            return serie[~chaves.duplicated(keep='last').to_numpy()]
+
+
+def wilson(sucessos, total, z=Z):
+    # Intervalo de confiança de Wilson para a proporção sucessos / total
+    sucessos = np.asarray(sucessos, dtype=np.float64)
+    total = np.asarray(total, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p = sucessos / total
+        z2 = z * z
+        denominador = 1 + z2 / total
+        centro = (p + z2 / (2 * total)) / denominador
+        margem = z * np.sqrt(p * (1 - p) / total + z2 / (4 * total * total)) / denominador
+    # Arredondamentos podem passar de 0 ou 1 por muito pouco
+    return np.clip(centro - margem, 0, 1), np.clip(centro + margem, 0, 1)
+
+
+def with_rates(tabela, z=Z):
+    # Taxa e intervalo de Wilson de cada janela a partir das contagens
+    tabela = tabela.copy()
+    for janela in JANELAS:
+        lancamentos, sucessos = tabela[f'{janela} Launches'], tabela[f'{janela} Successes']
+        tabela[f'{janela} Rate'] = sucessos / lancamentos
+        tabela[f'{janela} Low'], tabela[f'{janela} High'] = wilson(sucessos, lancamentos, z)
+    return tabela
+
+
+class Reliability:
+    # Contagens das duas janelas após cada lançamento, por grupo de 'coluna'
+
+    def __init__(self, lancamentos, coluna, ultimos=ULTIMOS, dias=DIAS):
+        self.column = coluna
+        self.last = ultimos
+        self.days = dias
+
+        categorias = lancamentos[coluna].array
+        codigos = np.asarray(categorias.codes, dtype=np.int64)
+        validos = codigos >= 0
+        # Ordem por grupo; a ordenação estável mantém a ordem de data dentro
+        # de cada grupo
+        ordem = np.argsort(np.where(validos, codigos, len(categorias.categories)), kind='stable')
+        ordem = ordem[:validos.sum()]
+        grupo = codigos[ordem]
+        dia = lancamentos['Date'].to_numpy()[ordem].astype('datetime64[D]').astype(np.int64)
+        sucesso = lancamentos['Success'].to_numpy()[ordem]
+
+        n = len(grupo)
+        posicao = np.arange(n)
+        acumulado = np.concatenate([[0], np.cumsum(sucesso)])
+        # Posição onde começa cada grupo
+        self._inicios = np.searchsorted(grupo, np.arange(len(categorias.categories) + 1))
+        primeiro = self._inicios[grupo]
+
+        # Últimos N lançamentos (ou menos, no começo do grupo)
+        inicio_n = np.maximum(posicao - ultimos + 1, primeiro)
+
+        # Últimos 'dias' dias: a chave grupo/dia é crescente nesta ordem, e o
+        # espaçamento entre grupos é maior que a janela, então a busca nunca
+        # cai em outro grupo
+        if n:
+            base = dia.min()
+            passo = dia.max() - base + dias + 1
+            chave = grupo * passo + (dia - base)
+            inicio_t = np.searchsorted(chave, chave - dias + 1)
+        else:
+            inicio_t = posicao
+
+        fim = posicao + 1
+        self.groups = list(categorias.categories)
+        self.table = pd.DataFrame({
+            'Date': dia.astype('datetime64[D]').astype('datetime64[us]'),
+            'Last Launches': (fim - inicio_n).astype(np.int32),
+            'Last Successes': (acumulado[fim] - acumulado[inicio_n]).astype(np.int32),
+            'Trailing Launches': (fim - inicio_t).astype(np.int32),
+            'Trailing Successes': (acumulado[fim] - acumulado[inicio_t]).astype(np.int32),
+        })
+        self.nbytes = int(self.table.memory_usage(deep=True).sum()) + self._inicios.nbytes
+
+    def _period(self, anos):
+        # Máscara das linhas no período ('anos' = (início, fim)), ou None
+        if anos is None:
+            return None
+        limites = np.array([f'{anos[0]}-01-01', f'{anos[1] + 1}-01-01'], dtype='datetime64[us]')
+        datas = self.table['Date'].to_numpy()
+        return (datas >= limites[0]) & (datas < limites[1])
+
+    def series(self, grupo, anos=None, max_pontos=None, z=Z):
+        # Taxas após cada lançamento do grupo no período, resumidas (ver
+        # sample) se passarem de 'max_pontos'
+        i = self.groups.index(grupo)
+        tabela = self.table.iloc[self._inicios[i]:self._inicios[i + 1]]
+        periodo = self._period(anos)
+        if periodo is not None:
+            tabela = tabela[periodo[self._inicios[i]:self._inicios[i + 1]]]
+        if max_pontos is not None:
+            tabela = sample(tabela, max_pontos)
+        return with_rates(tabela, z)
+
+    def ranking(self, anos=None, z=Z):
+        # Situação de cada grupo no seu último lançamento do período, com o
+        # número de lançamentos do grupo no período
+        grupo = np.repeat(np.arange(len(self.groups)), np.diff(self._inicios))
+        periodo = self._period(anos)
+        posicoes = np.arange(len(grupo)) if periodo is None else np.flatnonzero(periodo)
+        # As posições estão em ordem de grupo: o último lançamento de cada um
+        # é o fim da sua sequência
+        codigos, contagens = np.unique(grupo[posicoes], return_counts=True)
+        ultimos = posicoes[np.cumsum(contagens) - 1]
+        ranking = self.table.iloc[ultimos].reset_index(drop=True)
+        ranking.insert(0, 'Launches', contagens)
+        ranking.index = pd.Index([self.groups[c] for c in codigos], name=self.column)
+        return with_rates(ranking, z)
@@ -0,0 +1,229 @@
+import contextlib
+import hashlib
+import json
+import os
+import struct
+import time
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+
+from preprocess import SNAPSHOT_DIR
+
+# ------------------------------------
+# Dados compartilhados entre processos do servidor
+#
+# Com vários processos do Streamlit atrás de um balanceador, cada um teria a
+# sua cópia da tabela de missões e do cubo. Com MISSIONS_SHARED=1 o primeiro
+# processo a carregar uma versão dos dados publica as colunas em um bloco de
+# memória compartilhada (multiprocessing.shared_memory) e os demais apenas o
+# anexam: as colunas viram arrays do numpy apontando para o bloco, sem cópia,
+# e a memória ocupada é a de uma única cópia dos dados.
+#
+# Layout do bloco:
+#   - 8 bytes de identificação e 8 bytes com o tamanho do manifesto (gravado
+#     por último: zero indica um bloco ainda sendo preenchido);
+#   - o manifesto em JSON: para cada tabela, as colunas com tipo, posição e
+#     tamanho no bloco e, nas colunas categóricas, as categorias;
+#   - os dados das colunas, alinhados em 64 bytes.
+#
+# Colunas categóricas guardam só os códigos; colunas de texto são guardadas
+# como categóricas (e voltam assim). Os arrays anexados são somente leitura.
+#
+# O bloco de uma versão continua no sistema enquanto ela é a atual, mesmo
+# depois que o processo que o criou termina: um processo reiniciado anexa o
+# mesmo bloco em vez de publicar outra cópia ao lado da que os demais ainda
+# usam. Quem passa para uma versão nova remove o bloco da anterior (ver
+# unlink); quem ainda o tinha anexado continua com acesso até soltá-lo.
+
+SHARED = os.environ.get("MISSIONS_SHARED", "") == "1"
+
+MAGIC = b'MISSOES1'
+CABECALHO = struct.Struct('<8sQ')
+ALINHAMENTO = 64
+
+# Blocos anexados por este processo. Um bloco só é fechado quando nenhum
+# DataFrame aponta mais para ele (ver _release)
+_anexados = {}
+
+
+def block_name(version):
+    # Nomes de memória compartilhada têm tamanho limitado (31 caracteres no macOS)
+    return 'missoes_' + hashlib.sha1(version.encode()).hexdigest()[:20]
+
+
+def _alinhar(n):
+    return -(-n // ALINHAMENTO) * ALINHAMENTO
+
+
+def _columns(df):
+    # (array, descrição) de cada coluna de um DataFrame
+    colunas = []
+    for nome, serie in df.items():
+        if pd.api.types.is_string_dtype(serie.dtype) or serie.dtype == object:
+            serie = serie.astype('category')
+        dtype = serie.dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            valores = np.ascontiguousarray(serie.array.codes)
+            descricao = {'kind': 'category', 'categories': dtype.categories.tolist(), 'ordered': bool(dtype.ordered)}
+        elif isinstance(dtype, pd.DatetimeTZDtype):
+            valores = np.ascontiguousarray(serie.array.tz_localize(None)._ndarray)
+            descricao = {'kind': 'datetimetz', 'tz': str(dtype.tz)}
+        else:
+            valores = np.ascontiguousarray(serie.to_numpy())
+            descricao = {'kind': 'numpy'}
+        descricao.update(name=nome, dtype=valores.dtype.str, length=len(valores))
+        colunas.append((valores, descricao))
+    return colunas
+
+
+def publish(version, tables):
+    # 'tables' é um dict nome -> DataFrame (ou None). Retorna as tabelas
+    # anexadas ao bloco criado, para que o processo que publica também passe
+    # a usar a cópia compartilhada
+    manifesto = {}
+    colunas = []
+    posicao = 0
+    for tabela, df in tables.items():
+        if df is None:
+            manifesto[tabela] = None
+            continue
+        manifesto[tabela] = []
+        for valores, descricao in _columns(df):
+            descricao.update(offset=posicao, nbytes=valores.nbytes)
+            manifesto[tabela].append(descricao)
+            colunas.append((posicao, valores))
+            posicao = _alinhar(posicao + valores.nbytes)
+
+    texto = json.dumps(manifesto).encode()
+    inicio = _alinhar(CABECALHO.size + len(texto))
+    shm = shared_memory.SharedMemory(name=block_name(version), create=True, size=max(inicio + posicao, 1))
+    # Até o Python 3.12 o resource_tracker removeria o bloco do sistema quando
+    # este processo terminasse, mesmo com a versão ainda em uso
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    for offset, valores in colunas:
+        shm.buf[inicio + offset:inicio + offset + valores.nbytes] = valores.view(np.uint8)
+    shm.buf[CABECALHO.size:CABECALHO.size + len(texto)] = texto
+    shm.buf[:CABECALHO.size] = CABECALHO.pack(MAGIC, len(texto))
+
+    return _read(shm)
+
+
+def attach(version, timeout=30):
+    # Tabelas de uma versão já publicada, ou None se ninguém a publicou
+    try:
+        shm = shared_memory.SharedMemory(name=block_name(version))
+    except FileNotFoundError:
+        return None
+    # Até o Python 3.12 anexar também registra o bloco no resource_tracker
+    # (ver publish)
+    resource_tracker.unregister(shm._name, 'shared_memory')
+
+    limite = time.monotonic() + timeout
+    while CABECALHO.unpack_from(shm.buf)[1] == 0:
+        if time.monotonic() > limite:
+            shm.close()
+            return None
+        time.sleep(0.05)
+    return _read(shm)
+
+
+def _read(shm):
+    magic, tamanho = CABECALHO.unpack_from(shm.buf)
+    if magic != MAGIC:
+        raise ValueError(f"bloco de memória compartilhada desconhecido: {shm.name}")
+    manifesto = json.loads(bytes(shm.buf[CABECALHO.size:CABECALHO.size + tamanho]))
+    inicio = _alinhar(CABECALHO.size + tamanho)
+
+    tabelas = {}
+    for tabela, colunas in manifesto.items():
+        if colunas is None:
+            tabelas[tabela] = None
+            continue
+        dados = {}
+        for c in colunas:
+            valores = np.ndarray((c['length'],), dtype=np.dtype(c['dtype']), buffer=shm.buf, offset=inicio + c['offset'])
+            valores.flags.writeable = False
+            if c['kind'] == 'category':
+                valores = pd.Categorical.from_codes(valores, categories=c['categories'], ordered=c['ordered'], validate=False)
+            elif c['kind'] == 'datetimetz':
+                unidade = np.datetime_data(valores.dtype)[0]
+                valores = pd.array(valores, copy=False).view(pd.DatetimeTZDtype(unidade, c['tz']))
+            dados[c['name']] = pd.Series(valores, copy=False)
+        tabelas[tabela] = pd.DataFrame(dados, copy=False)
+
+    _release()
+    _anexados[shm.name] = shm
+    return tabelas
+
+
+def unlink(version):
+    # Remove do sistema o bloco de uma versão (se ainda existir). Quem já o
+    # anexou continua com acesso até fechá-lo
+    with contextlib.suppress(FileNotFoundError):
+        # Um handle novo: o unlink() tira do resource_tracker o registro que
+        # a abertura acabou de fazer
+        shm = shared_memory.SharedMemory(name=block_name(version))
+        shm.close()
+        shm.unlink()
+
+
+def _release():
+    # Fecha os blocos anexados que não estão mais em uso: enquanto algum
+    # DataFrame ainda aponta para o bloco, close() falha com BufferError e o
+    # bloco fica para a próxima tentativa
+    for nome, shm in list(_anexados.items()):
+        try:
+            shm.close()
+        except BufferError:
+            continue
+        del _anexados[nome]
+
+
+@contextlib.contextmanager
+def publish_lock():
+    # Trava entre processos: só um deles monta e publica uma versão, os
+    # outros esperam e anexam o resultado
+    import fcntl
+
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    with open(os.path.join(SNAPSHOT_DIR, "shared.lock"), 'w') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _replace_current(source, version):
+    # Registra 'version' como a atual da origem 'source' e remove o bloco da
+    # anterior, mesmo que nenhum processo vivo a tenha carregado (os dados
+    # mudaram com o servidor parado). Chamada com a trava de publicação
+    arquivo = os.path.join(SNAPSHOT_DIR, f"shared-{hashlib.sha1(source.encode()).hexdigest()[:12]}.current")
+    if os.path.exists(arquivo):
+        with open(arquivo) as f:
+            anterior = f.read()
+        if anterior and anterior != version:
+            unlink(anterior)
+    with open(arquivo, 'w') as f:
+        f.write(version)
+
+
+def get_or_publish(version, build, source=None):
+    # 'build' monta o dict de tabelas quando a versão ainda não foi publicada.
+    # Um bloco ainda sem manifesto está sendo preenchido por quem tem a trava,
+    # então a espera é pela trava e não pelo bloco
+    tabelas = attach(version, timeout=0)
+    if tabelas is not None:
+        return tabelas
+    with publish_lock():
+        tabelas = attach(version, timeout=0)
+        if tabelas is None:
+            # Com a trava, um bloco sem manifesto foi deixado por um processo
+            # que morreu no meio da publicação: é removido e refeito
+            unlink(version)
+            tabelas = publish(version, build())
+            if source is not None:
+                _replace_current(source, version)
+    return tabelas
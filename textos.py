@@ -0,0 +1,47 @@
+# ------------------------------------
+# Textos descritivos
+
+# Países
+grafico1 = 'Este gráfico resume a contribuição histórica acumulada de cada nação para a atividade de lançamento. A Rússia (ex-URSS) e os EUA dominam a lista com 1399 e 1381 lançamentos, respectivamente, reafirmando sua primazia histórica e o impacto da Guerra Fria na aceleração das missões espaciais. O Cazaquistão (701) aparece em terceiro devido ao uso do Cosmódromo de Baikonur, a primeira e maior base de lançamentos de foguetes do mundo. A França e a China seguem com números significativos (303 e 268), destacando suas capacidades espaciais bem estabelecidas, enquanto Japão e Índia também mostram um número considerável. A presença de Irã, Nova Zelândia e Israel com volumes menores indica a expansão do "clube espacial" para incluir países com programas mais recentes ou de nicho. Este gráfico é uma representação concisa da concentração de capacidade de lançamento espacial nas mãos de poucas potências ao longo da história.'
+
+# Ano
+grafico2 = 'O gráfico oferece uma perspectiva histórica sobre a frequência dos lançamentos. Observa-se um rápido crescimento nos anos 1960 e 1970, impulsionado pela corrida espacial entre EUA e URSS, com picos significativos por volta de 1967-1968 e novamente em meados dos anos 1970 (1975-1976), quando ambos os países realizavam dezenas de lançamentos anuais. Após esses picos, houve uma ligeira diminuição na frequência nos anos 1980 e 1990, e uma estabilização nos anos 2000. No entanto, a década de 2010 mostra um ressurgimento notável no número de lançamentos, com um novo pico em 2018 (quase 120 lançamentos), impulsionado pela ascensão de novos players como a China, o crescimento de empresas privadas e o aumento da demanda por serviços de lançamento de satélites, indicando uma nova era de expansão espacial.'
+
+# Mês
+grafico3 = 'O gráfico revela uma distribuição relativamente uniforme de lançamentos ao longo do ano, com uma leve tendência de aumento no final do ano. Dezembro se destaca como o mês com o maior número de lançamentos (450), seguido de perto por abril, junho e outubro. Essa distribuição sugere que não há sazonalidade climática ou operacional rígida que concentre lançamentos em apenas alguns meses, indicando que as janelas de lançamento são aproveitadas de forma consistente, possivelmente otimizando o uso das infraestruturas e atendendo a demandas de órbita específicas ou a prazos de projetos que se estendem ao longo de todo o ano.'
+
+# Dia da semana
+grafico4 = 'Este gráfico demonstra a frequência de lançamentos espaciais distribuída pelos dias da semana. Notavelmente, a maioria dos lançamentos ocorre nos dias úteis, com quartas, quintas e sextas-feiras apresentando o maior número de atividades. Há uma queda acentuada nos lançamentos durante os fins de semana, especialmente aos domingos, que mostram a menor quantidade. Essa distribuição reflete as operações típicas de uma indústria que segue um cronograma de trabalho padronizado, onde a disponibilidade de equipes, infraestrutura e apoio técnico é maior durante a semana comercial, priorizando a eficiência e coordenação das operações.'
+
+# Empresa
+grafico5 = 'O gráfico destaca a esmagadora contribuição histórica da RVSN URSS (Forças de Foguetes Estratégicos da União Soviética) com 1777 lançamentos, um número muito superior ao de qualquer outra entidade, reiterando o papel central da União Soviética na corrida espacial e na exploração inicial. A grande lacuna para a segunda colocada, Arianespace (279), e outras empresas como General Dynamics (251) e CASC (251), demonstra a magnitude do esforço espacial soviético. A presença de entidades militares como a US Air Force (161) e a VKS RF (201) (Forças Aeroespaciais Russas) sublinha a natureza frequentemente dual, civil e militar, das operações espaciais. A NASA (203) e empresas aeroespaciais tradicionais como Boeing (136), ULA (140) e Martin Marietta (114) também aparecem, mostrando a diversidade de atores que contribuíram para a história dos lançamentos espaciais. '
+
+# Pizza - Status das Missões
+grafico6 = 'O gráfico de pizza acima oferece uma visão consolidada da proporção de sucessos e falhas em todas as missões. Ele revela que a vasta maioria das missões espaciais, 89.7%, foi bem-sucedida, enquanto apenas 10.3% resultaram em falha. Essa alta taxa de sucesso global ressalta a maturidade e a confiabilidade das tecnologias de lançamento, mesmo considerando a complexidade inerente de enviar objetos ao espaço. É um testemunho da dedicação e precisão exigidas na engenharia espacial ao longo das décadas desde o início da era espacial. '
+
+# Razao de sucesso por ano
+grafico7 = 'Este gráfico ilustra a evolução da taxa de sucesso das missões espaciais desde 1957. Observa-se que, nas primeiras décadas da exploração espacial (final dos anos 1950 e início dos anos 1960), a taxa de sucesso era consideravelmente baixa, com picos de apenas 20% em 1958, refletindo os desafios e a natureza experimental dos primeiros lançamentos. Contudo, houve um rápido aprendizado e aprimoramento tecnológico, levando a um aumento constante na taxa de sucesso, que se estabilizou em patamares elevados, geralmente acima de 90%, a partir dos anos 1970. Embora haja pequenas flutuações e algumas quedas pontuais (como em meados dos anos 80 e 90, que podem coincidir com acidentes notórios como o desastre do Challenger ou falhas de foguetes), a tendência geral é de alta confiabilidade nas últimas décadas, demonstrando a maturidade e o avanço da engenharia aeroespacial.'
+
+# Sucesso x fracasso por ano
+grafico8 = 'O gráfico apresenta a relação entre lançamentos espaciais e o status das missões (sucesso ou falha) por ano, de 1957 a 2020. Observa-se um aumento significativo no número de lançamentos a partir da década de 1960, com picos notáveis durante a corrida espacial (décadas de 1960 e 1970), especialmente entre 1975 e 1977, quando os lançamentos ultrapassaram 100 por ano, com predominância de missões bem-sucedidas (barras verdes). A partir da década de 1980, o número de lançamentos diminuiu e se manteve relativamente estável até o início dos anos 2010, quando houve novo crescimento, atingindo outro pico em 2018. Ao longo do tempo, percebe-se uma tendência clara de aumento da taxa de sucesso, com a quantidade de falhas (barras vermelhas) diminuindo significativamente, evidenciando o avanço tecnológico e a maior confiabilidade dos lançamentos espaciais ao longo das décadas. '
+
+# Top 10 Países com mais lançamentos bem-sucedidos
+grafico9 = 'Observa-se que a Rússia e os EUA lideram com 1303 e 1219 lançamentos bem-sucedidos, respectivamente, o que reflete a vasta infraestrutura de lançamento que esses países construíram. O Cazaquistão, novamente, aparece em terceiro lugar com 608 lançamentos bem-sucedidos, reafirmando a importância do Cosmódromo de Baikonur como um dos locais mais ativos e bem-sucedidos na história dos lançamentos espaciais. A França e a China seguem com números significativos (285 e 243, respectivamente), mostrando a relevância de seus próprios locais de lançamento. A inclusão de "New Zealand" e "Kenya" pode indicar locais de lançamento flutuantes ou instalações costeiras usadas para trajetórias específicas, ou ainda a emergência de novos players com menor volume, como a Nova Zelândia com o Rocket Lab.'
+
+# Status das Missões por País
+grafico10 = 'O gráfico mostra a distribuição de sucessos e falhas por nação. A Rússia (ex-URSS) e os EUA, os dois maiores players históricos, apresentam o maior número de lançamentos bem-sucedidos (1306 e 1219, respectivamente) e também as maiores contagens de falhas (93 e 162, respectivamente). A proporção de falhas para os EUA é um pouco maior que a da Rússia em relação ao volume total de lançamentos, mas ambos os países demonstram uma alta taxa de sucesso. O Cazaquistão, embora não seja um país com capacidade primária de desenvolvimento de foguetes, possui um volume considerável de lançamentos a partir de seu território (608 sucessos e 93 falhas), novamente reforçando seu papel como uma importante base de lançamento. Países como França, China, Japão e Índia também exibem taxas de sucesso elevadas, consolidando suas posições como potências espaciais com capacidades de lançamento robustas.'
+
+# Pizza - Situação dos Foguetes
+grafico11 = 'O gráfico oferece uma visão geral concisa do estado da frota de foguetes, indicando que uma vasta maioria, 81.7%, está "Aposentada" (Retired), enquanto apenas 18.3% estão "Ativos" (Active). Essa distribuição é esperada, dada a natureza de uma atividade que se estende por décadas desde 1957; a maioria dos foguetes construídos e lançados ao longo da história naturalmente não está mais em operação. Isso reforça a importância da manutenção e desenvolvimento contínuo de novas tecnologias de lançamento para sustentar a atividade espacial, e também reflete a desativação de tecnologias antigas e a transição para sistemas mais eficientes e modernos '
+
+# Top 10 Países com mais Foguetes Ativos
+grafico12 = 'O gráfico apresenta os dez países com o maior número de foguetes ativos, destacando uma clara liderança dos Estados Unidos, com 245 foguetes, seguidos pela China, com 223. A diferença entre os dois primeiros e os demais é significativa, com a França ocupando o terceiro lugar com 113 foguetes, menos da metade do número norte-americano. Os demais países apresentam quantidades consideravelmente menores, como Índia (50), Cazaquistão (44), Japão (38) e Rússia (37), revelando uma concentração das capacidades espaciais em poucos países. Nova Zelândia (13), Irã (10) e Israel (5) completam a lista com números mais modestos, evidenciando uma disparidade na presença ativa no setor aeroespacial entre as nações.'
+
+# Top 10 Países com mais Foguetes Aposentados
+grafico13 = 'O gráfico apresenta os 10 países com o maior número de foguetes aposentados, ou seja, que já não estão mais em uso. A Rússia lidera com folga, totalizando 1.359 foguetes aposentados, seguida pelos Estados Unidos, com 1.136, e Cazaquistão, com 657. Esses três países possuem um histórico significativo de lançamentos espaciais, o que explica a quantidade elevada de foguetes desativados. Em seguida aparecem França (190), Japão (88) e China (45). Os últimos colocados são Índia (26), Quênia (9), Israel (6) e Austrália (6), demonstrando uma participação mais modesta nas atividades espaciais. O gráfico destaca o domínio histórico de algumas nações no setor aeroespacial, especialmente durante e após a Guerra Fria.'
+
+# Custo Médio das Missões Espaciais por País
+grafico14 = 'O gráfico indica que o Cazaquistão apresenta o custo médio mais alto por missão (aproximadamente 264 USD), seguido por EUA (aproximadamente 216 USD) e França (aproximadamente 171 USD). O elevado custo médio para o Cazaquistão, que abriga o Cosmódromo de Baikonur, sugere que as operações a partir deste local, frequentemente de grande porte e complexidade, contribuem para esse valor. A presença de "Gran Canaria" e "Pacific Missile Range Facility" pode se referir a instalações de rastreamento ou apoio a missões, não necessariamente países lançadores. Notavelmente, Rússia e China, apesar de serem grandes players em número de lançamentos, aparecem com custos médios significativamente mais baixos (40.54 e 40.27, respectivamente), o que pode refletir metodologias de custo diferentes, uma maior padronização de lançadores ou uma política de preços distinta.'
+
+# Custo Médio das Missões Espaciais por Empresa
+grafico15 = 'Este gráfico mostra uma disparidade gritante, com a RVSN URSS liderando com um custo médio de 5000 USD por missão, valor consideravelmente superior ao de qualquer outra entidade. Essa cifra elevadíssima para a RVSN URSS pode ser um reflexo dos vastos recursos investidos no desenvolvimento de foguetes e mísseis intercontinentais durante a Guerra Fria, onde a performance e a capacidade eram priorizadas sobre a economia, ou talvez uma inclusão de custos de desenvolvimento que não são comparáveis com outras empresas. A NASA aparece em segundo lugar, mas com um custo médio muito inferior (aproximadamente 511 USD), seguida por empresas como Boeing (177 USD), Arianespace (170 USD) e ULA (151 USD). A JAXA (Agência de Exploração Aeroespacial do Japão) e a US Air Force também apresentam custos médios mais baixos, indicando que, fora o caso histórico da RVSN URSS, o custo médio por missão para as demais grandes agências e empresas é substancialmente menor e mais nivelado.'
@@ -0,0 +1,75 @@
+import pandas as pd
+
+# ------------------------------------
+# Série temporal de lançamentos em várias resoluções
+#
+# Com 60+ anos de lançamentos, a série por dia tem mais de 20 mil pontos por
+# status, grande demais para mandar ao navegador a cada rerun. A pirâmide guarda
+# a mesma série já somada por dia, semana, mês e ano, montada uma vez a partir
+# da contagem diária (ver aggregates.py). Para um período, pick() escolhe a
+# resolução mais fina em que o período cabe em MAX_INTERVALOS, então o tamanho
+# de cada gráfico fica limitado qualquer que seja o período escolhido.
+
+# (código, nome, regra de agrupamento do pandas). Semanas começam na segunda
+RESOLUCOES = [
+    ('D', 'Dia', 'D'),
+    ('W', 'Semana', 'W-MON'),
+    ('M', 'Mês', 'MS'),
+    ('Y', 'Ano', 'YS'),
+]
+
+# Cada intervalo vira um ponto por status (sucesso e falha): 2 x 1000 pontos,
+# o limite de charts.MAX_PONTOS
+MAX_INTERVALOS = 1000
+
+STATUS = ['Success', 'Failure']
+
+
+class Pyramid:
+
+    def __init__(self, daily):
+        dias = (
+            daily.groupby(['Date', 'Mission Status'], observed=True)['Count'].sum()
+            .unstack(fill_value=0)
+            .reindex(columns=STATUS, fill_value=0)
+        )
+        self.levels = {}
+        for codigo, _, regra in RESOLUCOES:
+            # Intervalos sem lançamentos ficam com zero
+            self.levels[codigo] = dias.resample(regra, closed='left', label='left').sum()
+        self.nbytes = sum(int(n.memory_usage(deep=True).sum()) for n in self.levels.values())
+
+    def date_range(self):
+        dias = self.levels['D'].index
+        if len(dias) == 0:
+            return None
+        return dias[0], dias[-1]
+
+    def count(self, codigo, inicio, fim):
+        # Número de intervalos da resolução que cobrem [inicio, fim]
+        i, j = self._bounds(codigo, inicio, fim)
+        return j - i
+
+    def options(self, inicio, fim, max_intervalos=MAX_INTERVALOS):
+        # Resoluções em que o período cabe no limite, da mais fina à mais grossa
+        return [codigo for codigo, _, _ in RESOLUCOES if self.count(codigo, inicio, fim) <= max_intervalos]
+
+    def pick(self, inicio, fim, max_intervalos=MAX_INTERVALOS):
+        opcoes = self.options(inicio, fim, max_intervalos)
+        return opcoes[0] if opcoes else RESOLUCOES[-1][0]
+
+    def series(self, codigo, inicio, fim):
+        i, j = self._bounds(codigo, inicio, fim)
+        return self.levels[codigo].iloc[i:j]
+
+    def _bounds(self, codigo, inicio, fim):
+        # Inclui o intervalo que contém 'inicio' (uma semana ou mês que começa
+        # antes do período)
+        indice = self.levels[codigo].index
+        i = max(indice.searchsorted(pd.Timestamp(inicio), side='right') - 1, 0)
+        j = indice.searchsorted(pd.Timestamp(fim), side='right')
+        return i, j
+
+
+def resolution_name(codigo):
+    return {c: nome for c, nome, _ in RESOLUCOES}[codigo]